@@ -1,11 +1,22 @@
 """Common Polar Expressions
 """
 
-from typing import Any
+from operator import eq, ge, gt, le, lt
+from typing import Any, Callable
 
 import polars as pl
 
 
+PREDICATE_FN_DICT: dict[str, Callable[[pl.Expr, Any], pl.Expr]] = {
+    "==": eq,
+    "<": lt,
+    "<=": le,
+    ">=": ge,
+    ">": gt,
+    "in": lambda col_expr, true_val: col_expr.is_in(set(true_val)),
+}
+
+
 def parse_date(col_name, format: str, **kwargs) -> pl.Expr:
     """"""
     return pl.col(col_name).str.to_date(format, **kwargs)
@@ -68,22 +79,14 @@ def if_else(
 
 def get_predicate_expr(col_name: str, operator: str, true_val: Any) -> pl.Expr:
     """"""
-    col_expr = pl.col(col_name)
-    match operator:
-        case "==":
-            return col_expr == true_val
-        case "<":
-            return col_expr < true_val
-        case "<=":
-            return col_expr <= true_val
-        case ">=":
-            return col_expr >= true_val
-        case ">":
-            return col_expr > true_val
-        case "in":
-            return col_expr.is_in(set(true_val))
-        case _:
-            raise NotImplementedError(f"Operator {operator} is not yet implemented.")
+    try:
+        predicate_fn = PREDICATE_FN_DICT[operator]
+    except KeyError:
+        raise NotImplementedError(
+            f"Operator {operator} is not yet implemented."
+        ) from None
+
+    return predicate_fn(pl.col(col_name), true_val)
 
 
 def approx_years_between(start_date_col: str, end_date_col: str) -> pl.Expr:
@@ -129,9 +132,9 @@ def approx_years_between(start_date_col: str, end_date_col: str) -> pl.Expr:
     │ 1.4997241665518486  │
     └─────────────────────┘
     """
-    duration = pl.col(end_date_col) - pl.col(start_date_col)
+    num_days = days_between(start_date_col, end_date_col)
 
-    return duration.dt.total_days() / 365.25
+    return num_days / 365.25
 
 
 def approx_months_between(start_date_col: str, end_date_col: str) -> pl.Expr:
@@ -177,6 +180,38 @@ def approx_months_between(start_date_col: str, end_date_col: str) -> pl.Expr:
     │ 18.329394616840275   │
     └──────────────────────┘
     """
-    duration = pl.col(end_date_col) - pl.col(start_date_col)
+    num_days = days_between(start_date_col, end_date_col)
+
+    return 12 * num_days / 365.25
+
+
+def days_between(start_date_col: str, end_date_col: str) -> pl.Expr:
+    """Return the number of whole days between the start and end date.
+
+    Parameters
+    ----------
+    start_date_col : str
+        The name of the column containing the start dates.
+    end_date_col : str
+        The name of the column containing the end dates.
+
+    Returns
+    -------
+    pl.Expr
+        A Polars expression representing the difference in days.
+
+    Notes
+    -----
+    The dates are converted to days since the epoch and subtracted as
+    integers, so no intermediate Duration column is built.
+
+    The columns are expected to be of Date type. Datetime columns are cast
+    to Date first, so the result is the number of calendar days between
+    them, not the whole number of 24-hour periods. For example, 23:00 to
+    01:00 the next day is 1 day.
+    """
+    start_date = pl.col(start_date_col).cast(pl.Date)
+
+    end_date = pl.col(end_date_col).cast(pl.Date)
 
-    return 12 * duration.dt.total_days() / 365.25
+    return end_date.dt.epoch("d") - start_date.dt.epoch("d")
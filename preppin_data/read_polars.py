@@ -1,52 +1,59 @@
 """Module for reading data into Polars DataFrames."""
 
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Callable
 from zipfile import ZipFile
 
 import polars as pl
 
 
-"""Module for reading data into Polars DataFrames."""
-
-from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Callable
-from zipfile import ZipFile
-
-import polars as pl
-
-
-def read_zip_file(zip_file: str) -> dict[str, pl.DataFrame]:
-    """Extract data from a ZIP file and ingest it into a dictionary of Polars DataFrames.
+def read_zip_file(
+    zip_file: str, schema_overrides: dict[str, pl.PolarsDataType] | None = None
+) -> dict[str, pl.DataFrame]:
+    """Ingest the data in a ZIP file into a dictionary of Polars DataFrames.
 
     Parameters
     ----------
     zip_file : str
         The path to the ZIP file containing the data.
+    schema_overrides : dict[str, pl.PolarsDataType], optional
+        The data types of columns that should not be inferred, by default None.
 
     Returns
     -------
     dict[str, pl.DataFrame]
         A dictionary mapping file names to Polars DataFrames containing the extracted data.
-    """
-    with TemporaryDirectory() as tmp_dir:
-        tmp_dir_path = Path(tmp_dir)
 
-        with ZipFile(zip_file) as zf:
-            zf.extractall(tmp_dir_path)
+    Notes
+    -----
+    Each file is read from the archive into memory and passed straight to
+    Polars, so nothing is extracted to disk.
+    Only the files at the top level of the archive are read.
+    """
+    data_dict = {}
+    with ZipFile(zip_file) as zf:
+        for info in zf.infolist():
+            if not info.is_dir() and "/" not in info.filename:
+                data_dict[info.filename] = read_source(
+                    BytesIO(zf.read(info)), Path(info.filename).suffix, schema_overrides
+                )
 
-        return read_directory(tmp_dir_path)
+    return data_dict
 
 
-def read_directory(directory: Path) -> dict[str, pl.DataFrame]:
+def read_directory(
+    directory: Path, schema_overrides: dict[str, pl.PolarsDataType] | None = None
+) -> dict[str, pl.DataFrame]:
     """Collect data files from a directory and ingest them into a dictionary of Polars DataFrames.
 
     Parameters
     ----------
     directory : Path
         The path to the directory containing the data files.
+    schema_overrides : dict[str, pl.PolarsDataType], optional
+        The data types of columns that should not be inferred, by default None.
 
     Returns
     -------
@@ -57,25 +64,36 @@ def read_directory(directory: Path) -> dict[str, pl.DataFrame]:
     ------
     FileNotFoundError
         If the specified directory does not exist.
+
+    Notes
+    -----
+    The files are read concurrently on a thread pool. Polars releases the
+    GIL while parsing, so the reads overlap.
     """
     if not directory.exists():
         raise FileNotFoundError(f"FAILED: Directory {directory} does not exist.")
 
-    data_dict = {}
-    for file_path in directory.iterdir():
-        if file_path.is_file():
-            data_dict[file_path.name] = read_file(file_path)
+    file_paths = [file_path for file_path in directory.iterdir() if file_path.is_file()]
 
-    return data_dict
+    with ThreadPoolExecutor() as executor:
+        data_frames = executor.map(
+            lambda file_path: read_file(file_path, schema_overrides), file_paths
+        )
+
+        return dict(zip((file_path.name for file_path in file_paths), data_frames))
 
 
-def read_file(file_path: Path) -> pl.DataFrame:
+def read_file(
+    file_path: Path, schema_overrides: dict[str, pl.PolarsDataType] | None = None
+) -> pl.DataFrame:
     """Read data from a file into a Polars DataFrame.
 
     Parameters
     ----------
     file_path : Path
         The path to the file to be read.
+    schema_overrides : dict[str, pl.PolarsDataType], optional
+        The data types of columns that should not be inferred, by default None.
 
     Returns
     -------
@@ -88,6 +106,8 @@ def read_file(file_path: Path) -> pl.DataFrame:
     based on the file extension and attempts to read the file.
     If the file encoding is not utf8, then it falls back to using the
     'utf8-lossy' encoding.
+    Columns given in `schema_overrides` are read with the given data type,
+    which skips inferring their type from the data.
 
     Examples
     --------
@@ -96,12 +116,71 @@ def read_file(file_path: Path) -> pl.DataFrame:
     >>> df.shape()
     (1000, 5)
     """
-    read_fn = get_polars_read_strategy(file_path.suffix)
+    return read_source(file_path, file_path.suffix, schema_overrides)
+
+
+def scan_file(
+    file_path: Path, schema_overrides: dict[str, pl.PolarsDataType] | None = None
+) -> pl.LazyFrame:
+    """Lazily read data from a file into a Polars LazyFrame.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the file to be read.
+    schema_overrides : dict[str, pl.PolarsDataType], optional
+        The data types of columns that should not be inferred, by default None.
+
+    Returns
+    -------
+    pl.LazyFrame
+        A Polars LazyFrame representing the data in the file.
+
+    Notes
+    -----
+    CSV files are scanned, so projections and filters in the downstream
+    query are pushed into the reader, and the file is never held in memory
+    as a whole. The encoding cannot be checked until the query is collected,
+    so CSV files are always scanned with the 'utf8-lossy' encoding.
+    Other file formats are read eagerly with `read_file`.
+    """
+    if file_path.suffix.lower() == ".csv":
+        return pl.scan_csv(
+            file_path, schema_overrides=schema_overrides, encoding="utf8-lossy"
+        )
+
+    return read_file(file_path, schema_overrides).lazy()
+
+
+def read_source(
+    source: Path | BytesIO,
+    suffix: str,
+    schema_overrides: dict[str, pl.PolarsDataType] | None = None,
+) -> pl.DataFrame:
+    """Read data from a file or an in-memory buffer into a Polars DataFrame.
+
+    Parameters
+    ----------
+    source : Path | BytesIO
+        The path to the file, or a buffer holding its contents.
+    suffix : str
+        The file suffix indicating the file format.
+    schema_overrides : dict[str, pl.PolarsDataType], optional
+        The data types of columns that should not be inferred, by default None.
+
+    Returns
+    -------
+    pl.DataFrame
+        A Polars DataFrame containing the data read from the source.
+    """
+    read_fn = get_polars_read_strategy(suffix)
 
     try:
-        return read_fn(file_path)
+        return read_fn(source, schema_overrides=schema_overrides)
     except pl.ComputeError:
-        return read_fn(file_path, encoding="utf8-lossy")
+        if isinstance(source, BytesIO):
+            source.seek(0)
+        return read_fn(source, schema_overrides=schema_overrides, encoding="utf8-lossy")
 
 
 def get_polars_read_strategy(suffix: str) -> Callable[..., pl.DataFrame]:
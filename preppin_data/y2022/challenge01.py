@@ -10,10 +10,16 @@ Outputs
 """
 
 from datetime import date
+from functools import lru_cache
 
 import polars as pl
 
 
+ACADEMIC_YEAR_STARTS = pl.Series(
+    [date(2011, 9, 1), date(2012, 9, 1), date(2013, 9, 1), date(2014, 9, 1)]
+)
+
+
 def solve(pd_2022_wk1_fsrc: str) -> pl.DataFrame:
     """Solve challenge 1 of Preppin' Data 2022.
 
@@ -29,14 +35,9 @@ def solve(pd_2022_wk1_fsrc: str) -> pl.DataFrame:
     """
 
     # Preprocess the data
-    pre_data = preprocess_pupil_contact_data(pd_2022_wk1_fsrc)
-
-    # Normalise the data
-    pupil = pre_data.pipe(normalize_pupil)
+    pre_data = collect_pupil_contact_data(pd_2022_wk1_fsrc).lazy()
 
-    parent_contact = pre_data.pipe(normalize_parental_contact)
-
-    return view_preferred_parental_contact_details(pupil, parent_contact).collect()
+    return view_preferred_parental_contact_details(pre_data).collect()
 
 
 def preprocess_pupil_contact_data(pd_2022_wk1_fsrc: str) -> pl.LazyFrame:
@@ -62,6 +63,34 @@ def preprocess_pupil_contact_data(pd_2022_wk1_fsrc: str) -> pl.LazyFrame:
     return data.pipe(reshape_pupil_contact_data).pipe(clean_pupil_contact_data)
 
 
+@lru_cache(maxsize=1)
+def collect_pupil_contact_data(pd_2022_wk1_fsrc: str) -> pl.DataFrame:
+    """Collect the preprocessed pupil contact data.
+
+    Parameters
+    ----------
+    pd_2022_wk1_fsrc : str
+        Filepath of the pupil contact CSV file.
+
+    Returns
+    -------
+    pl.DataFrame
+        DataFrame containing the preprocessed pupil contact data.
+
+    Notes
+    -----
+    The result is cached on the filepath, so challenges 1, 2 and 3 share a
+    single parse and clean of the Week 1 input when solved in the same
+    session.
+
+    The cache is keyed only on the filepath, not on the file's contents. If
+    the file is rewritten in the same session, the stale result is returned
+    until `collect_pupil_contact_data.cache_clear()` is called.
+    """
+
+    return preprocess_pupil_contact_data(pd_2022_wk1_fsrc).collect()
+
+
 def load_data(pd_2022_wk1_fsrc: str) -> pl.LazyFrame:
     """Load the input data from the given path.
 
@@ -74,9 +103,18 @@ def load_data(pd_2022_wk1_fsrc: str) -> pl.LazyFrame:
     -------
     pl.LazyFrame
         LazyFrame representing the input data.
+
+    Notes
+    -----
+    Every column is read as a string, apart from the given integer columns,
+    so the data types are not inferred.
     """
 
-    return pl.scan_csv(pd_2022_wk1_fsrc)
+    return pl.scan_csv(
+        pd_2022_wk1_fsrc,
+        infer_schema_length=0,
+        schema_overrides={"id": pl.Int64, "Parental Contact": pl.Int64},
+    )
 
 
 def reshape_pupil_contact_data(data: pl.LazyFrame) -> pl.LazyFrame:
@@ -103,6 +141,7 @@ def reshape_pupil_contact_data(data: pl.LazyFrame) -> pl.LazyFrame:
             "Preferred Contact Employer",
             "Parental Contact",
         ],
+        value_vars=["Parental Contact Name_1", "Parental Contact Name_2"],
         variable_name="parental_contact_number",
         value_name="parental_contact_first_name",
     )
@@ -155,91 +194,72 @@ def normalize_pupil(pre_data: pl.LazyFrame) -> pl.LazyFrame:
     Primary key is {pupil_id}
     """
 
-    return pre_data.drop(
-        "parental_contact_number", "parental_contact_first_name"
-    ).unique("pupil_id")
+    return (
+        pre_data.drop("parental_contact_number", "parental_contact_first_name")
+        .group_by("pupil_id")
+        .agg(pl.all().first())
+    )
 
 
-def normalize_parental_contact(pre_data: pl.LazyFrame) -> pl.LazyFrame:
-    """Normalize the pupil contact data.
+def view_preferred_parental_contact_details(pre_data: pl.LazyFrame) -> pl.LazyFrame:
+    """View pupil's preferred parental contact details.
 
     Parameters
     ----------
-    pl.LazyFrame
-        LazyFrame representing the preprocessed input data.
+    pre_data : pl.LazyFrame
+        LazyFrame representing the preprocessed pupil contact data.
 
     Returns
     -------
     pl.LazyFrame
-        LazyFrame representing the normalized pupil contact data.
+        LazyFrame representing pupil's preferred parental contact details.
 
     Notes
     -----
-    Primary key is {pupil_id, parental_contact_number}
+    Each row of the preprocessed data already holds the pupil's details, so
+    the preferred parental contact is selected with a filter rather than by
+    joining the pupils back to their parental contacts.
+
+    The academic year is found with a binary search of the pupil's date of
+    birth in `ACADEMIC_YEAR_STARTS`. Pupils born before the first start
+    date have no academic year.
     """
 
     # Expressions
     parental_contact_number_expr = (
-        pl.col("parental_contact_number").str.extract(r"(\d+)$").cast(pl.Int64)
+        pl.col("parental_contact_number")
+        .str.strip_prefix("Parental Contact Name_")
+        .cast(pl.Int64)
     )
 
-    return pre_data.select(
-        "pupil_id",
-        parental_contact_number_expr,
-        "parental_contact_first_name",
+    is_preferred_parental_contact_expr = (
+        parental_contact_number_expr == pl.col("preferred_parental_contact_number")
     )
 
+    num_academic_years_started_expr = pl.lit(ACADEMIC_YEAR_STARTS).search_sorted(
+        pl.col("born_on"), side="right"
+    )
 
-def view_preferred_parental_contact_details(
-    pupil: pl.LazyFrame, parental_contact: pl.LazyFrame
-) -> pl.LazyFrame:
-    """View pupil's preferred parental contact details.
-
-    Parameters
-    ----------
-    pupil : pl.LazyFrame
-        LazyFrame representing the normalized pupil data.
-    parental_contact : pl.LazyFrame
-        LazyFrame representing the normalized parental contact data.
-
-    Returns
-    -------
-    pl.LazyFrame
-        LazyFrame representing pupil's preferred parental contact details.
-    """
-
-    # Expressions
     academic_year_expr = (
-        pl.when(pl.col("born_on") >= date(2014, 9, 1))
-        .then(pl.lit(1))
-        .when(pl.col("born_on") >= date(2013, 9, 1))
-        .then(pl.lit(2))
-        .when(pl.col("born_on") >= date(2012, 9, 1))
-        .then(pl.lit(3))
-        .when(pl.col("born_on") >= date(2011, 9, 1))
-        .then(pl.lit(4))
+        pl.when(num_academic_years_started_expr > 0)
+        .then(ACADEMIC_YEAR_STARTS.len() + 1 - num_academic_years_started_expr)
+        .cast(pl.Int32)
     )
 
-    pupil_full_name_expr = pl.col("first_name") + " " + pl.col("last_name")
+    pupil_full_name_expr = pl.format("{} {}", "first_name", "last_name")
 
-    parental_contact_full_name_expr = (
-        pl.col("parental_contact_first_name") + " " + pl.col("last_name")
+    parental_contact_full_name_expr = pl.format(
+        "{} {}", "parental_contact_first_name", "last_name"
     )
 
-    parental_contact_email_expr = (
-        pl.col("parental_contact_first_name")
-        + "."
-        + pl.col("last_name")
-        + "@"
-        + pl.col("preferred_parental_contact_employer")
-        + ".com"
+    parental_contact_email_expr = pl.format(
+        "{}.{}@{}.com",
+        "parental_contact_first_name",
+        "last_name",
+        "preferred_parental_contact_employer",
     ).str.to_lowercase()
 
-    return pupil.join(
-        parental_contact,
-        left_on=["pupil_id", "preferred_parental_contact_number"],
-        right_on=["pupil_id", "parental_contact_number"],
-    ).select(
+    return pre_data.filter(is_preferred_parental_contact_expr).select(
         academic_year=academic_year_expr,
         pupil_full_name=pupil_full_name_expr,
         parental_contact_full_name=parental_contact_full_name_expr,
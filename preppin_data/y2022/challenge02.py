@@ -17,6 +17,27 @@ from . import challenge01
 
 CALENDAR_YEAR = 2022
 
+MONTH = pl.Enum(
+    [
+        "January",
+        "February",
+        "March",
+        "April",
+        "May",
+        "June",
+        "July",
+        "August",
+        "September",
+        "October",
+        "November",
+        "December",
+    ]
+)
+
+WEEKDAY = pl.Enum(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+)
+
 
 def solve(input_fsrc: str) -> pl.DataFrame:
     """Solve challenge 2 of Preppin' Data 2022.
@@ -34,7 +55,7 @@ def solve(input_fsrc: str) -> pl.DataFrame:
     """
 
     # Preprocess the data
-    pre_data = challenge01.preprocess_pupil_contact_data(input_fsrc)
+    pre_data = challenge01.collect_pupil_contact_data(input_fsrc).lazy()
 
     # Normalise the pupil data
     pupil = pre_data.pipe(challenge01.normalize_pupil)
@@ -46,10 +67,7 @@ def solve(input_fsrc: str) -> pl.DataFrame:
         aggregate_num_birthdays_per_month_weekday, CALENDAR_YEAR
     )
 
-    return (
-        pupil_birthday.collect(),
-        num_birthdays_per_month_weekday.collect(),
-    )
+    return tuple(pl.collect_all([pupil_birthday, num_birthdays_per_month_weekday]))
 
 
 def view_pupil_birthday(pupil: pl.LazyFrame, calendar_year: int) -> pl.LazyFrame:
@@ -71,24 +89,24 @@ def view_pupil_birthday(pupil: pl.LazyFrame, calendar_year: int) -> pl.LazyFrame
     Notes
     -----
     Primary key is {pupil_id}
+
+    The birthday month and weekday are Enums, so they sort in calendar
+    order.
+
+    Pupils born on 29 February have no birthday when `calendar_year` is not
+    a leap year.
     """
 
     # Expressions
     born_on = pl.col("born_on")
 
-    this_year_birthday_date_str_expr = (
-        str(calendar_year)
-        + "-"
-        + born_on.dt.month().cast(pl.Utf8)
-        + "-"
-        + born_on.dt.day().cast(pl.Utf8)
+    this_year_birthday_expr = pl.date(
+        calendar_year, born_on.dt.month(), born_on.dt.day()
     )
 
-    this_year_birthday_expr = this_year_birthday_date_str_expr.str.to_date()
-
-    birthday_month_expr = born_on.dt.strftime("%B")
+    birthday_month_expr = born_on.dt.strftime("%B").cast(MONTH)
 
-    birthday_weekday_expr = this_year_birthday_expr.dt.strftime("%A")
+    birthday_weekday_expr = this_year_birthday_expr.dt.strftime("%A").cast(WEEKDAY)
 
     return pupil.select(
         "pupil_id",
@@ -121,6 +139,8 @@ def aggregate_num_birthdays_per_month_weekday(
     # Collect the data
     pupil_birthday = pupil.pipe(view_pupil_birthday, calendar_year)
 
-    return pupil_birthday.group_by("birthday_month", "birthday_weekday").agg(
-        pl.len().alias("count")
+    return (
+        pupil_birthday.select("birthday_month", "birthday_weekday")
+        .group_by("birthday_month", "birthday_weekday")
+        .agg(pl.len().alias("count"))
     )
@@ -44,7 +44,7 @@ def solve(pd_input_wk1_fsrc: str, pd_input_w3_fsrc: str) -> pl.DataFrame:
     """
 
     # Preprocess and normalise the pupil data
-    pre_week1_data = challenge01.preprocess_pupil_contact_data(pd_input_wk1_fsrc)
+    pre_week1_data = challenge01.collect_pupil_contact_data(pd_input_wk1_fsrc).lazy()
 
     pupil = pre_week1_data.pipe(challenge01.normalize_pupil)
 
@@ -166,18 +166,22 @@ def view_pupil_performance_summary(
     This function calculates pupil performance metrics such as the number
     of subjects passed and the mean score.
 
-    Primary key is {pupil_id}.
+    Primary key is {pupil_id}. The gender is determined by the pupil, so it
+    is taken from the first row of each pupil rather than grouped on.
     """
 
     # Collect the data
     pupil_performance = view_pupil_performance(pupil, pupil_grade)
 
     # Expressions
+    gender_expr = pl.first("gender")
+
     num_subjects_passed_expr = pl.sum("did_pass")
 
     mean_score_expr = pl.mean("score")
 
-    return pupil_performance.group_by("pupil_id", "gender").agg(
+    return pupil_performance.group_by("pupil_id").agg(
+        gender=gender_expr,
         num_subjects_passed=num_subjects_passed_expr,
         mean_score=mean_score_expr,
     )
@@ -203,8 +207,6 @@ def view_pupil_performance(
     """
 
     # Expressions
-    did_pass_expr = (
-        pl.when(pl.col("score") >= 75).then(pl.lit(True)).otherwise(pl.lit(False))
-    )
+    did_pass_expr = pl.col("score") >= 75
 
     return pupil.join(pupil_grade, on="pupil_id").with_columns(did_pass=did_pass_expr)
@@ -17,32 +17,55 @@ in the output depends on it. We therefore discarded this direction.
 import polars as pl
 
 
-MODE_OF_TRANSPORT = pl.LazyFrame(
-    [
-        ("Aeroplane", "Aeroplane", False),
-        ("Bycycle", "Bicycle", True),
-        ("Bicycle", "Bicycle", True),
-        ("Car", "Car", False),
-        ("Carr", "Car", False),
-        ("Dad's Shoulders", "Mum's Shoulders", True),
-        ("Helicopter", "Helicopter", False),
-        ("Helicopeter", "Helicopter", False),
-        ("Hopped", "Hopped", True),
-        ("Jumped", "Jumped", True),
-        ("Mum's Shoulders", "Mum's Shoulders", True),
-        ("Scooter", "Scooter", True),
-        ("Scootr", "Scooter", True),
-        ("Scoter", "Scooter", True),
-        ("Skipped", "Skipped", True),
-        ("Van", "Van", False),
-        ("Walk", "Walk", True),
-        ("WAlk", "Walk", True),
-        ("Waalk", "Walk", True),
-        ("Walkk", "Walk", True),
-        ("Wallk", "Walk", True),
-    ],
-    schema=["orig_mode_of_transport", "mode_of_transport", "is_sustainable"],
-)
+MODE_OF_TRANSPORT_MAP = {
+    "Aeroplane": "Aeroplane",
+    "Bycycle": "Bicycle",
+    "Bicycle": "Bicycle",
+    "Car": "Car",
+    "Carr": "Car",
+    "Dad's Shoulders": "Mum's Shoulders",
+    "Helicopter": "Helicopter",
+    "Helicopeter": "Helicopter",
+    "Hopped": "Hopped",
+    "Jumped": "Jumped",
+    "Mum's Shoulders": "Mum's Shoulders",
+    "Scooter": "Scooter",
+    "Scootr": "Scooter",
+    "Scoter": "Scooter",
+    "Skipped": "Skipped",
+    "Van": "Van",
+    "Walk": "Walk",
+    "WAlk": "Walk",
+    "Waalk": "Walk",
+    "Walkk": "Walk",
+    "Wallk": "Walk",
+}
+
+IS_SUSTAINABLE_MAP = {
+    "Aeroplane": False,
+    "Bicycle": True,
+    "Car": False,
+    "Helicopter": False,
+    "Hopped": True,
+    "Jumped": True,
+    "Mum's Shoulders": True,
+    "Scooter": True,
+    "Skipped": True,
+    "Van": False,
+    "Walk": True,
+}
+
+WEEKDAY_MAP = {
+    "M": "Monday",
+    "Tu": "Tuesday",
+    "W": "Wednesday",
+    "Th": "Thursday",
+    "F": "Friday",
+}
+
+MODE_OF_TRANSPORT = pl.Enum(list(IS_SUSTAINABLE_MAP))
+
+WEEKDAY = pl.Enum(list(WEEKDAY_MAP.values()))
 
 
 def solve(pd_input_w4_fsrc: str) -> pl.DataFrame:
@@ -66,7 +89,7 @@ def solve(pd_input_w4_fsrc: str) -> pl.DataFrame:
 
     # Preprocess the pupil travel plans data
     pupil_daily_travel_preference = preprocess_pupil_daily_travel_preference_data(
-        pd_input_w4_fsrc, MODE_OF_TRANSPORT
+        pd_input_w4_fsrc
     )
 
     # Collect the output
@@ -78,7 +101,7 @@ def solve(pd_input_w4_fsrc: str) -> pl.DataFrame:
 
 
 def preprocess_pupil_daily_travel_preference_data(
-    pd_input_w4_fsrc: str, mode_of_transport: pl.LazyFrame
+    pd_input_w4_fsrc: str,
 ) -> pl.LazyFrame:
     """Preprocess the pupil daily travel preference data.
 
@@ -86,9 +109,6 @@ def preprocess_pupil_daily_travel_preference_data(
     ----------
     pd_input_w4_fsrc : str
         Filepath of the input CSV file for Week 4.
-    mode_of_transport : pl.LazyFrame
-        LazyFrame representing the mode of study and whether or not it
-        is sustainable.
 
     Returns
     -------
@@ -105,11 +125,7 @@ def preprocess_pupil_daily_travel_preference_data(
     return (
         load_data(pd_input_w4_fsrc)
         .pipe(reshape_pupil_daily_travel_preference_data)
-        .pipe(
-            clean_pupil_daily_travel_preference_data,
-            mode_of_transport,
-            # weekday_map,
-        )
+        .pipe(clean_pupil_daily_travel_preference_data)
     )
 
 
@@ -125,9 +141,18 @@ def load_data(pd_input_w4_fsrc: str) -> pl.LazyFrame:
     -------
     pl.LazyFrame
         LazyFrame representing the loaded data.
+
+    Notes
+    -----
+    Every column is read as a string, apart from the student ID, so the
+    data types are not inferred.
     """
 
-    return pl.scan_csv(pd_input_w4_fsrc)
+    return pl.scan_csv(
+        pd_input_w4_fsrc,
+        infer_schema_length=0,
+        schema_overrides={"Student ID": pl.Int64},
+    )
 
 
 def reshape_pupil_daily_travel_preference_data(data: pl.LazyFrame) -> pl.LazyFrame:
@@ -152,7 +177,7 @@ def reshape_pupil_daily_travel_preference_data(data: pl.LazyFrame) -> pl.LazyFra
 
 
 def clean_pupil_daily_travel_preference_data(
-    reshaped_data: pl.LazyFrame, mode_of_transport: pl.LazyFrame
+    reshaped_data: pl.LazyFrame,
 ) -> pl.LazyFrame:
     """Clean the reshaped pupil daily travel preference data.
 
@@ -161,39 +186,41 @@ def clean_pupil_daily_travel_preference_data(
     reshaped_data : pl.LazyFrame
         LazyFrame representing the reshaped pupil daily travel preference
         data.
-    mode_of_transport : pl.LazyFrame
-        LazyFrame representing the mode of study and whether or not it is
-        sustainable.
 
     Returns
     -------
     pl.LazyFrame
         LazyFrame representing the cleaned pupil daily travel preference
         data.
+
+    Notes
+    -----
+    The mode of transport, whether it is sustainable, and the weekday are
+    looked up with `replace` on the module-level maps, so no join is
+    needed. Values missing from the maps are null. The mode of transport and
+    the weekday are Enums.
     """
 
     col_mapper = {"Student ID": "pupil_id"}
 
     # Expressions
-    weekyday_code = pl.col("weekday_code")
-
-    weekyday_expr = (
-        pl.when(weekyday_code == "M")
-        .then(pl.lit("Monday"))
-        .when(weekyday_code == "Tu")
-        .then(pl.lit("Tuesday"))
-        .when(weekyday_code == "W")
-        .then(pl.lit("Wednesday"))
-        .when(weekyday_code == "Th")
-        .then(pl.lit("Thursday"))
-        .when(weekyday_code == "F")
-        .then(pl.lit("Friday"))
-        .otherwise(pl.lit(None))
+    mode_of_transport_expr = pl.col("orig_mode_of_transport").replace(
+        MODE_OF_TRANSPORT_MAP, default=None, return_dtype=MODE_OF_TRANSPORT
+    )
+
+    is_sustainable_expr = pl.col("mode_of_transport").replace(
+        IS_SUSTAINABLE_MAP, default=None, return_dtype=pl.Boolean
+    )
+
+    weekday_expr = pl.col("weekday_code").replace(
+        WEEKDAY_MAP, default=None, return_dtype=WEEKDAY
     )
 
     return (
-        reshaped_data.join(mode_of_transport, on="orig_mode_of_transport", how="left")
-        .with_columns(weekday=weekyday_expr)
+        reshaped_data.with_columns(
+            mode_of_transport=mode_of_transport_expr, weekday=weekday_expr
+        )
+        .with_columns(is_sustainable=is_sustainable_expr)
         .drop("orig_mode_of_transport", "weekday_code")
         .rename(col_mapper)
     )
@@ -211,41 +238,24 @@ def view_daily_travel_preference_summary(pre_data: pl.LazyFrame) -> pl.LazyFrame
     -------
     pl.LazyFrame
         LazyFrame representing the summary of pupil travel plans.
+
+    Notes
+    -----
+    The total number of trips per weekday is summed over the aggregated
+    trips per mode of transport, rather than aggregated and joined back.
     """
 
     # Aggreate the data
-    num_trips_per_weekday = pre_data.pipe(aggregate_num_trips_per_weekday)
-
     num_trips_per_mode_weekday = pre_data.pipe(aggregate_num_trips_per_mode_weekday)
 
     # Expressions
-    pct_trips_expr = 100 * (pl.col("num_trips") / pl.col("total_trips")).round(3)
+    total_trips_expr = pl.sum("num_trips").over("weekday")
 
-    return (
-        num_trips_per_mode_weekday.join(num_trips_per_weekday, on="weekday")
-        .with_columns(pct_trips=pct_trips_expr)
-        .drop("weekday_count")
-    )
-
-
-def aggregate_num_trips_per_weekday(pre_data: pl.LazyFrame) -> pl.LazyFrame:
-    """Aggregate the number of trips per weekday.
-
-    Parameters
-    ----------
-    pre_data : pl.LazyFrame
-        LazyFrame representing preprocessed pupil travel plan data.
-
-    Returns
-    -------
-    pl.LazyFrame
-        LazyFrame representing the aggregated number of trips per weekday.
-    """
-
-    # Expressions
-    total_trips_expr = pl.len()
+    pct_trips_expr = 100 * (pl.col("num_trips") / pl.col("total_trips")).round(3)
 
-    return pre_data.group_by("weekday").agg(total_trips=total_trips_expr)
+    return num_trips_per_mode_weekday.with_columns(
+        total_trips=total_trips_expr
+    ).with_columns(pct_trips=pct_trips_expr)
 
 
 def aggregate_num_trips_per_mode_weekday(pre_data: pl.LazyFrame) -> pl.LazyFrame:
@@ -11,8 +11,9 @@ Outputs
 
 Notes
 -----
-There are small differences in the assigned grades (and thus the GPA) because
-the `qcut` function is not equivalent to Tableau's Tiling function.
+There may be small differences in the assigned grades (and thus the GPA)
+because pupils with tied scores are split between grades by row order, which
+may not match the order used by Tableau's Tiling function.
 
 We also deviate from the required output, instead returning the pupil's
 total grade points and the GPA per grade.
@@ -23,6 +24,11 @@ import polars as pl
 from . import challenge03
 
 
+GRADES = ["F", "E", "D", "C", "B", "A"]
+
+GRADE_POINTS = [1, 2, 4, 6, 8, 10]
+
+
 def solve(pd_input_w3_fsrc: str) -> tuple[pl.DataFrame]:
     """Solve challenge 5 of Preppin' Data 2022.
 
@@ -46,21 +52,28 @@ def solve(pd_input_w3_fsrc: str) -> tuple[pl.DataFrame]:
     # Preprocess the pupil grade data
     pre_data = challenge03.preprocess_pupil_grade_data(pd_input_w3_fsrc)
 
+    # View the pupil grade points
+    pupil_subject_grade_point = pre_data.pipe(view_pupil_subject_grade_point)
+
     # Collect the output
-    total_grade_points = pre_data.pipe(aggregate_total_grade_points)
+    total_grade_points = pupil_subject_grade_point.pipe(aggregate_total_grade_points)
 
-    gpa_per_grade = pre_data.pipe(aggregate_grade_point_average_per_grade)
+    gpa_per_grade = pupil_subject_grade_point.pipe(
+        aggregate_grade_point_average_per_grade, total_grade_points
+    )
 
-    return total_grade_points.collect(), gpa_per_grade.collect()
+    return tuple(pl.collect_all([total_grade_points, gpa_per_grade]))
 
 
-def aggregate_total_grade_points(pre_data: pl.LazyFrame) -> pl.LazyFrame:
+def aggregate_total_grade_points(
+    pupil_subject_grade_point: pl.LazyFrame,
+) -> pl.LazyFrame:
     """Aggregate total grade points per pupil.
 
     Parameters
     ----------
-    pre_data : pl.LazyFrame
-        LazyFrame representing preprocessed pupil grade data.
+    pupil_subject_grade_point : pl.LazyFrame
+        LazyFrame representing pupil grade points per subject.
 
     Returns
     -------
@@ -68,9 +81,6 @@ def aggregate_total_grade_points(pre_data: pl.LazyFrame) -> pl.LazyFrame:
         LazyFrame representing the total grade points per pupil.
     """
 
-    # Collect the data
-    pupil_subject_grade_point = pre_data.pipe(view_pupil_subject_grade_point)
-
     # Expressions
     total_grade_points_expr = pl.sum("grade_point")
 
@@ -79,13 +89,17 @@ def aggregate_total_grade_points(pre_data: pl.LazyFrame) -> pl.LazyFrame:
     )
 
 
-def aggregate_grade_point_average_per_grade(pre_data: pl.LazyFrame) -> pl.LazyFrame:
+def aggregate_grade_point_average_per_grade(
+    pupil_subject_grade_point: pl.LazyFrame, total_grade_points: pl.LazyFrame
+) -> pl.LazyFrame:
     """Aggregate average grade point per grade.
 
     Parameters
     ----------
-    pre_data : pl.LazyFrame
-        LazyFrame representing preprocessed pupil grade data.
+    pupil_subject_grade_point : pl.LazyFrame
+        LazyFrame representing pupil grade points per subject.
+    total_grade_points : pl.LazyFrame
+        LazyFrame representing the total grade points per pupil.
 
     Returns
     -------
@@ -93,11 +107,6 @@ def aggregate_grade_point_average_per_grade(pre_data: pl.LazyFrame) -> pl.LazyFr
         LazyFrame representing the average grade point per grade.
     """
 
-    # Collect the data
-    pupil_subject_grade_point = pre_data.pipe(view_pupil_subject_grade_point)
-
-    total_grade_points = pre_data.pipe(aggregate_total_grade_points)
-
     # Expressions
     grade_point_average_expr = pl.mean("total_grade_points").round(2)
 
@@ -120,36 +129,36 @@ def view_pupil_subject_grade_point(pre_data: pl.LazyFrame) -> pl.LazyFrame:
     -------
     pl.LazyFrame
         LazyFrame representing pupil grade points per subject.
+
+    Notes
+    -----
+    The scores in each subject are ranked and split into `len(GRADES)`
+    equal-sized tiles, where ties are split by row order. The tile is the
+    index of the grade, and so is mapped directly to both the grade and its
+    grade point.
+
+    Only the non-null scores in a subject are tiled, so a null score is
+    given a null grade and grade point.
     """
 
     # Expressions
-    grade_expr = (
-        pl.col("score")
-        .qcut(6, labels=["F", "E", "D", "C", "B", "A"])
-        .over("subject_name")
-        .cast(pl.Utf8)
+    tile_expr = (
+        (pl.col("score").rank("ordinal").over("subject_name") - 1)
+        * len(GRADES)
+        // pl.col("score").count().over("subject_name")
     )
 
-    grade = pl.col("grade")
-
-    grade_point_expr = (
-        pl.when(grade == "A")
-        .then(pl.lit(10))
-        .when(grade == "B")
-        .then(pl.lit(8))
-        .when(grade == "C")
-        .then(pl.lit(6))
-        .when(grade == "D")
-        .then(pl.lit(4))
-        .when(grade == "E")
-        .then(pl.lit(2))
-        .when(grade == "F")
-        .then(pl.lit(1))
-        .otherwise(pl.lit(None))
+    grade_expr = tile_expr.replace(
+        dict(enumerate(GRADES)), return_dtype=pl.Enum(GRADES)
+    )
+
+    grade_point_expr = tile_expr.replace(
+        dict(enumerate(GRADE_POINTS)), return_dtype=pl.Int8
     )
 
     return pre_data.select(
         "pupil_id",
         "subject_name",
         grade=grade_expr,
-    ).with_columns(grade_point=grade_point_expr)
+        grade_point=grade_point_expr,
+    )
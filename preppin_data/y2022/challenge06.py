@@ -7,16 +7,21 @@ Inputs
 Outputs
 -------
 - output/2022/wk06_seven_letter_word_analysis.ndjson
-
-Notes
------
-We set the float precision to suppress Polar's use of scientific notation.
 """
 
+from functools import reduce
+from operator import mul
+from string import ascii_uppercase
+
 import polars as pl
 
 
-pl.Config.set_float_precision(14)
+WORD_LENGTH = 7
+
+SHEET_COLUMNS = {
+    "7 letter words": ["7 letter word"],
+    "Scrabble Scores": ["Scrabble"],
+}
 
 
 def solve(seven_letter_word_fsrc: str) -> pl.DataFrame:
@@ -39,7 +44,7 @@ def solve(seven_letter_word_fsrc: str) -> pl.DataFrame:
     """
 
     # Load the data
-    data_dict = load_data(seven_letter_word_fsrc)
+    data_dict = load_data(seven_letter_word_fsrc, SHEET_COLUMNS)
 
     # Preprocess the data
     word = data_dict["7 letter words"].pipe(preprocess_words_data)
@@ -52,13 +57,17 @@ def solve(seven_letter_word_fsrc: str) -> pl.DataFrame:
     return seven_letter_word_analysis
 
 
-def load_data(seven_letter_word_fsrc: str) -> dict[str, pl.DataFrame]:
+def load_data(
+    seven_letter_word_fsrc: str, sheet_columns: dict[str, list[str]]
+) -> dict[str, pl.DataFrame]:
     """Load data from the input Excel file.
 
     Parameters
     ----------
     seven_letter_word_fsrc : str
         Filepath of the input XLSX file for Week 6.
+    sheet_columns : dict[str, list[str]]
+        The columns to read from each sheet, keyed by sheet name.
 
     Returns
     -------
@@ -66,9 +75,22 @@ def load_data(seven_letter_word_fsrc: str) -> dict[str, pl.DataFrame]:
         A dictionary containing Polars DataFrames with loaded data.
         The keys are the names of the sheets in the Excel file,
         and the values are the corresponding DataFrames.
+
+    Notes
+    -----
+    The workbook is parsed with the calamine engine, which requires the
+    `fastexcel` package. Only the given columns of each sheet are parsed.
     """
 
-    data_dict = pl.read_excel(seven_letter_word_fsrc, sheet_id=0)
+    data_dict = {
+        sheet_name: pl.read_excel(
+            seven_letter_word_fsrc,
+            sheet_name=sheet_name,
+            engine="calamine",
+            read_options={"use_columns": columns},
+        )
+        for sheet_name, columns in sheet_columns.items()
+    }
 
     return data_dict
 
@@ -119,24 +141,26 @@ def clean_scrabble_scores_data(data: pl.DataFrame) -> pl.DataFrame:
     -------
     pl.DataFrame
         DataFrame containing the cleansed scrabble scores data.
+
+    Notes
+    -----
+    Each score is of the form "<points> point(s): <tile> <frequency>, ...",
+    so it is parsed by splitting on its separators rather than with regular
+    expressions. The blank tile is given the letter "_".
     """
 
     # Expressions
     scrabble = pl.col("Scrabble").str.replace_all("×", "")
 
-    points_patt = r"^(\d+)"
-
-    points_expr = scrabble.str.extract(points_patt).cast(pl.Int64)
-
-    tiles_patt = r"(\w+)\s(\d+)"
+    points_expr = scrabble.str.split(" ").list.first().cast(pl.Int8)
 
-    tiles_expr = scrabble.str.extract_all(tiles_patt)
+    tiles_expr = scrabble.str.split(": ").list.last().str.split(", ")
 
-    clean_tiles_expr = pl.col("tiles").str.replace("Blank", "_")
+    tile = pl.col("tiles").str.split(" ")
 
-    letter_expr = clean_tiles_expr.str.extract(r"([A-Z])")
+    letter_expr = tile.list.first().str.replace("Blank", "_")
 
-    frequency_expr = clean_tiles_expr.str.extract(r"(\d+)").cast(pl.Int64)
+    frequency_expr = tile.list.last().cast(pl.Int8)
 
     return (
         data.with_columns(points=points_expr, tiles=tiles_expr)
@@ -168,14 +192,17 @@ def view_seven_letter_word_analysis(
     """
 
     # Collect the data
-    word_probability = view_word_probability(word, scrabble_score)
+    agg_letters_per_word = aggregate_letters_per_word(word)
+
+    word_probability = view_word_probability(agg_letters_per_word, scrabble_score)
 
-    total_points_per_word = view_total_points_per_word(word, scrabble_score)
+    total_points_per_word = view_total_points_per_word(
+        agg_letters_per_word, scrabble_score
+    )
 
     return (
         word.join(word_probability, on="word")
         .join(total_points_per_word, on="word")
-        .filter(pl.col("probability") > 0)
         .with_columns(
             probability_rank=pl.col("probability").rank("min", descending=True),
             total_points_rank=pl.col("total_points").rank("min", descending=True),
@@ -184,15 +211,15 @@ def view_seven_letter_word_analysis(
 
 
 def view_word_probability(
-    word: pl.DataFrame, scrabble_score: pl.DataFrame
+    agg_letters_per_word: pl.DataFrame, scrabble_score: pl.DataFrame
 ) -> pl.DataFrame:
     """View the probability of drawing all the tiles necessary to create
     each word.
 
     Parameters
     ----------
-    word : pl.DataFrame
-        DataFrame containing the preprocessed seven-letter words data.
+    agg_letters_per_word : pl.DataFrame
+        DataFrame containing the frequency of each letter in each word.
     scrabble_score : pl.DataFrame
         DataFrame containing the preprocessed scrabble scores data.
 
@@ -201,23 +228,44 @@ def view_word_probability(
     pl.DataFrame
         DataFrame containing te probability of drawing all titles needed
         to create a word.
+
+    Notes
+    -----
+    Words that need more of some letter than there are tiles have a
+    probability of zero, and so are dropped before the probability is
+    calculated.
+
+    A letter appears at most `WORD_LENGTH` times in a word, so its
+    probability is raised to its frequency by repeated multiplication rather
+    than a floating point power.
     """
 
     # Collect the data
     letter_probability = view_letter_probability(scrabble_score)
 
-    agg_letters_per_word = aggregate_letters_per_word(word)
-
     # Expressions
-    partial_probability_expr = (
-        pl.when(pl.col("word_frequency") <= pl.col("frequency"))
-        .then(pl.col("probability").pow("word_frequency"))
-        .otherwise(pl.lit(0))
+    is_possible_expr = (
+        (pl.col("word_frequency") <= pl.col("frequency")).all().over("word")
+    )
+
+    probability = pl.col("probability")
+
+    word_frequency = pl.col("word_frequency")
+
+    partial_probability_expr = pl.when(word_frequency == 1).then(probability)
+
+    for exponent in range(2, WORD_LENGTH + 1):
+        partial_probability_expr = partial_probability_expr.when(
+            word_frequency == exponent
+        ).then(reduce(mul, [probability] * exponent))
+
+    partial_probability_expr = partial_probability_expr.otherwise(
+        probability.pow(word_frequency)
     )
 
     return (
-        agg_letters_per_word.join(scrabble_score, on="letter")
-        .join(letter_probability, on="letter")
+        agg_letters_per_word.join(letter_probability, on="letter")
+        .filter(is_possible_expr)
         .with_columns(partial_probability=partial_probability_expr)
         .group_by("word")
         .agg(probability=pl.col("partial_probability").product())
@@ -231,6 +279,12 @@ def view_letter_probability(scrabble_score: pl.DataFrame) -> pl.DataFrame:
     ----------
     scrabble_score : pl.DataFrame
         DataFrame containing the preprocessed scrabble scores data.
+
+    Returns
+    -------
+    pl.DataFrame
+        DataFrame containing the frequency of each letter tile, and the
+        probability of it being drawn.
     """
 
     frequency = pl.col("frequency")
@@ -239,7 +293,7 @@ def view_letter_probability(scrabble_score: pl.DataFrame) -> pl.DataFrame:
 
     probability_expr = frequency / num_tiles_expr
 
-    return scrabble_score.select("letter", probability=probability_expr)
+    return scrabble_score.select("letter", "frequency", probability=probability_expr)
 
 
 def aggregate_letters_per_word(word: pl.DataFrame) -> pl.DataFrame:
@@ -254,26 +308,38 @@ def aggregate_letters_per_word(word: pl.DataFrame) -> pl.DataFrame:
     -------
     pl.DataFrame
         DataFrame containing the probability of a letter tile being drawn.
+
+    Notes
+    -----
+    Each letter of the alphabet is counted in every word in a single pass,
+    and letters that do not appear in a word are dropped.
     """
 
+    # Expressions
+    letter_frequency_exprs = [
+        pl.col("word")
+        .str.count_matches(letter, literal=True)
+        .cast(pl.UInt8)
+        .alias(letter)
+        for letter in ascii_uppercase
+    ]
+
     return (
-        word.with_columns(letter=pl.col("word").str.split(by=""))
-        .explode("letter")
-        .group_by("word", "letter")
-        .agg(word_frequency=pl.len())
-        .filter(pl.col("letter") != "")
+        word.select("word", *letter_frequency_exprs)
+        .melt(id_vars="word", variable_name="letter", value_name="word_frequency")
+        .filter(pl.col("word_frequency") > 0)
     )
 
 
 def view_total_points_per_word(
-    word: pl.DataFrame, scrabble_score: pl.DataFrame
+    agg_letters_per_word: pl.DataFrame, scrabble_score: pl.DataFrame
 ) -> pl.DataFrame:
     """View the total points each word is worth.
 
     Parameters
     ----------
-    word : pl.DataFrame
-        DataFrame containing the preprocessed seven-letter words data.
+    agg_letters_per_word : pl.DataFrame
+        DataFrame containing the frequency of each letter in each word.
     scrabble_score : pl.DataFrame
         DataFrame containing the preprocessed scrabble scores data.
 
@@ -283,9 +349,6 @@ def view_total_points_per_word(
         DataFrame containing the total points each word is worth.
     """
 
-    # Collect the data
-    agg_letters_per_word = aggregate_letters_per_word(word)
-
     # Expressions
     partial_total_points_expr = pl.col("word_frequency") * pl.col("points")
 
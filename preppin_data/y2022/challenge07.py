@@ -15,6 +15,27 @@ import polars as pl
 
 CALENDAR_YEAR = 2021
 
+MONTH_NUMBER_MAP = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+PEOPLE_SHEET_COLUMNS = {
+    "People": None,
+    "Leaders": ["id", "first_name", "last_name"],
+    "Location": ["Location ID", "Location"],
+}
+
 
 def solve(metric_data_fsrc: str, peope_data_fsrc: str) -> pl.DataFrame:
     """Solve challenge 7 of Preppin' Data 2022.
@@ -42,7 +63,7 @@ def solve(metric_data_fsrc: str, peope_data_fsrc: str) -> pl.DataFrame:
     # Load the data
     metric_data_dict = load_data(metric_data_fsrc)
 
-    peope_data_dict = load_data(peope_data_fsrc)
+    peope_data_dict = load_data(peope_data_fsrc, PEOPLE_SHEET_COLUMNS)
 
     # Preprocess the data
     agent_metric = preprocess_agent_metric_data(
@@ -68,13 +89,18 @@ def solve(metric_data_fsrc: str, peope_data_fsrc: str) -> pl.DataFrame:
     return agent_monthly_performance
 
 
-def load_data(fsrc: str) -> dict[str, pl.DataFrame]:
+def load_data(
+    fsrc: str, sheet_columns: dict[str, list[str] | None] | None = None
+) -> dict[str, pl.DataFrame]:
     """Load data from the input Excel file.
 
     Parameters
     ----------
     fsrc : str
         Filepath of the input XLSX file.
+    sheet_columns : dict[str, list[str] | None], optional
+        The columns to read from each sheet, keyed by sheet name, where None
+        reads every column, by default None, which reads every sheet.
 
     Returns
     -------
@@ -82,9 +108,26 @@ def load_data(fsrc: str) -> dict[str, pl.DataFrame]:
         A dictionary containing Polars DataFrames with loaded data. The
         keys are the names of the sheets in the Excel file, and the values
         are the corresponding DataFrames.
+
+    Notes
+    -----
+    The workbook is parsed with the calamine engine, which requires the
+    `fastexcel` package. When `sheet_columns` is given, only the given
+    sheets and columns are parsed.
     """
 
-    data_dict = pl.read_excel(fsrc, sheet_id=0)
+    if sheet_columns is None:
+        return pl.read_excel(fsrc, sheet_id=0, engine="calamine")
+
+    data_dict = {
+        sheet_name: pl.read_excel(
+            fsrc,
+            sheet_name=sheet_name,
+            engine="calamine",
+            read_options={"use_columns": columns},
+        )
+        for sheet_name, columns in sheet_columns.items()
+    }
 
     return data_dict
 
@@ -106,18 +149,24 @@ def preprocess_agent_metric_data(
     -------
     pl.DataFrame
         DataFrame containing the preprocessed agent metric data.
-    """
-
-    pre_data_arr = []
 
-    for sheet_name, data in metric_data_dict.items():
-        harmonized_data = data.pipe(harmonize_monthly_agent_metric_data)
-
-        pre_data = harmonized_data.pipe(clean_monthly_metric_data, sheet_name, year)
+    Notes
+    -----
+    The harmonized monthly sheets are stacked, with the sheet name as the
+    month name, so every month is cleaned in one pass.
+    """
 
-        pre_data_arr.append(pre_data)
+    harmonized_data = pl.concat(
+        [
+            data.pipe(harmonize_monthly_agent_metric_data).with_columns(
+                month_name=pl.lit(sheet_name)
+            )
+            for sheet_name, data in metric_data_dict.items()
+        ],
+        how="diagonal_relaxed",
+    )
 
-    return pl.concat(pre_data_arr, how="diagonal")
+    return harmonized_data.pipe(clean_monthly_metric_data, year)
 
 
 def harmonize_monthly_agent_metric_data(data: pl.DataFrame) -> pl.DataFrame:
@@ -133,51 +182,62 @@ def harmonize_monthly_agent_metric_data(data: pl.DataFrame) -> pl.DataFrame:
     -------
     pl.DataFrame
         DataFrame containing the harmonized monthly agent metric data.
+
+    Notes
+    -----
+    The metric names differ between months, so each metric column is renamed
+    to its harmonized name.
     """
 
-    # Expressions
-    orig_metric_name = pl.col("orig_metric_name")
-
-    new_metric_name_expr = (
-        pl.when(orig_metric_name.str.contains("Offered"))
-        .then(pl.lit("num_calls_offered"))
-        .when(orig_metric_name.str.contains("Not Answered"))
-        .then(pl.lit("num_calls_not_answered"))
-        .when(orig_metric_name.str.contains("Answered"))
-        .then(pl.lit("num_calls_answered"))
-        .when(orig_metric_name == "Total Duration")
-        .then(pl.lit("total_duration"))
-        .when(orig_metric_name == "Sentiment")
-        .then(pl.lit("call_sentiment"))
-        .when(orig_metric_name == "Transfers")
-        .then(pl.lit("num_calls_transferred"))
-        .otherwise(pl.lit(None))
-    )
+    col_mapper = {
+        orig_metric_name: harmonize_metric_name(orig_metric_name)
+        for orig_metric_name in data.columns
+    }
 
-    return (
-        data.melt(id_vars="AgentID", variable_name="orig_metric_name")
-        .with_columns(new_metric_name=new_metric_name_expr)
-        .pivot(
-            values="value",
-            index="AgentID",
-            columns="new_metric_name",
-        )
+    return data.rename(
+        {orig_name: new_name for orig_name, new_name in col_mapper.items() if new_name}
     )
 
 
-def clean_monthly_metric_data(
-    harmonized_data: pl.DataFrame,
-    month_name: str,
-    year: int,
-) -> pl.DataFrame:
+def harmonize_metric_name(orig_metric_name: str) -> str | None:
+    """Return the harmonized name of a metric.
+
+    Parameters
+    ----------
+    orig_metric_name : str
+        The name of the metric in the input XLSX file.
+
+    Returns
+    -------
+    str | None
+        The harmonized name of the metric, or None if the metric is not
+        recognised.
+    """
+
+    if "Offered" in orig_metric_name:
+        return "num_calls_offered"
+    elif "Not Answered" in orig_metric_name:
+        return "num_calls_not_answered"
+    elif "Answered" in orig_metric_name:
+        return "num_calls_answered"
+    elif orig_metric_name == "Total Duration":
+        return "total_duration"
+    elif orig_metric_name == "Sentiment":
+        return "call_sentiment"
+    elif orig_metric_name == "Transfers":
+        return "num_calls_transferred"
+    else:
+        return None
+
+
+def clean_monthly_metric_data(harmonized_data: pl.DataFrame, year: int) -> pl.DataFrame:
     """Clean the harmonized monthly agent metric data.
 
     Parameters
     ----------
     pl.DataFrame
-        DataFrame containing the harmonized monthly agent metric data.
-    month_name : str
-        Month the metric data was collected as locale's abbreviated name.
+        DataFrame containing the harmonized monthly agent metric data, where
+        the month is given as the locale's abbreviated name.
     year : int
         Calendar year the metric data was collected.
 
@@ -185,22 +245,29 @@ def clean_monthly_metric_data(
     -------
     pl.DataFrame
         DataFrame containing the cleansed monthly agent metric data.
+
+    Notes
+    -----
+    The month number is looked up in `MONTH_NUMBER_MAP`, rather than parsed
+    from a date string.
     """
 
     col_mapper = {"AgentID": "agent_id"}
 
     # Expressions
-    month_name_expr = pl.lit(month_name)
-
-    year_expr = pl.lit(year).cast(pl.Utf8)
-
-    collected_in_expr = month_name_expr + "-" + year_expr
+    collected_in_expr = pl.format("{}-{}", "month_name", pl.lit(year))
 
-    month_number_expr = ("01-" + collected_in_expr).str.to_date("%d-%b-%Y").dt.month()
+    month_number_expr = pl.col("month_name").replace(
+        MONTH_NUMBER_MAP, default=None, return_dtype=pl.Int8
+    )
 
-    return harmonized_data.with_columns(
-        collected_in=collected_in_expr, month_number=month_number_expr
-    ).rename(col_mapper)
+    return (
+        harmonized_data.with_columns(
+            collected_in=collected_in_expr, month_number=month_number_expr
+        )
+        .drop("month_name")
+        .rename(col_mapper)
+    )
 
 
 def preprocess_agent_data(data: pl.DataFrame) -> pl.DataFrame:
@@ -343,11 +410,17 @@ def view_agent_performance(
     agent, including metrics such as call response rate, average call duration,
     and sentiment analysis results. It combines data from multiple DataFrames
     to create a comprehensive overview of agent performance.
+
+    Only each agent's first leader is kept, so the agents are filtered
+    before they are joined to the leaders and locations, and the joins are
+    run as a single lazy query.
     """
 
     # Collect the data
     agent_monthly_performance = agent_metric.pipe(scaffold_agent_monthly_performance)
 
+    primary_leader_agent = agent.filter(pl.col("leader_number") == 1)
+
     # Expressions
     rate_calls_not_answered_expr = pl.col("num_calls_not_answered") / pl.col(
         "num_calls_offered"
@@ -355,25 +428,14 @@ def view_agent_performance(
 
     mean_call_duration_expr = pl.col("total_duration") / pl.col("num_calls_answered")
 
-    had_postive_call_sentiment_expr = (
-        pl.when(pl.col("call_sentiment") >= 0)
-        .then(pl.lit(True))
-        .when(pl.col("call_sentiment") < 0)
-        .then(pl.lit(False))
-        .otherwise(pl.lit(None))
-    )
+    had_postive_call_sentiment_expr = pl.col("call_sentiment") >= 0
 
-    did_meet_rate_call_not_answered_threshold_expr = (
-        pl.when(rate_calls_not_answered_expr >= 0.05)
-        .then(pl.lit(False))
-        .when(rate_calls_not_answered_expr < 0.05)
-        .then(pl.lit(True))
-        .otherwise(pl.lit(None))
-    )
+    did_meet_rate_call_not_answered_threshold_expr = rate_calls_not_answered_expr < 0.05
 
     return (
-        agent_monthly_performance.join(
-            agent_metric,
+        agent_monthly_performance.lazy()
+        .join(
+            agent_metric.lazy(),
             on=[
                 "agent_id",
                 "month_number",
@@ -381,10 +443,9 @@ def view_agent_performance(
             ],
             how="left",
         )
-        .join(agent, on="agent_id")
-        .join(leader, on="leader_id")
-        .join(location, on="location_id")
-        .filter(pl.col("leader_number") == 1)
+        .join(primary_leader_agent.lazy(), on="agent_id")
+        .join(leader.lazy(), on="leader_id")
+        .join(location.lazy(), on="location_id")
         .select(
             "collected_in",
             "month_number",
@@ -399,6 +460,7 @@ def view_agent_performance(
             ),
         )
         .sort("agent_id", "month_number")
+        .collect()
     )
 
 
@@ -447,4 +509,4 @@ def full_name_expr(first_name: str, last_name: str) -> pl.Expr:
         A Polars expression that represents the full name concatenation.
     """
 
-    return pl.col(last_name) + ", " + pl.col(first_name)
+    return pl.concat_str(last_name, first_name, separator=", ")
@@ -39,16 +39,16 @@ def solve(pokemon_fsrc: str) -> pl.DataFrame:
     data_dict = load_data(pokemon_fsrc)
 
     # Unpack and preprocess the data
-    pokemon = data_dict["pkmn_stats"]
+    pokemon = data_dict["pkmn_stats"].lazy()
 
-    pokemon_evolution = data_dict["pkmn_evolutions"].pipe(
-        preprocess_pokemon_evolutions_data
+    pokemon_evolution = (
+        data_dict["pkmn_evolutions"].lazy().pipe(preprocess_pokemon_evolutions_data)
     )
 
     # Collect the output
     combat_power_analysis = view_combat_power_analysis(pokemon, pokemon_evolution)
 
-    return combat_power_analysis
+    return combat_power_analysis.collect()
 
 
 def load_data(fsrc: str) -> dict[str, pl.DataFrame]:
@@ -65,25 +65,30 @@ def load_data(fsrc: str) -> dict[str, pl.DataFrame]:
         A dictionary containing Polars DataFrames with loaded data. The
         keys are the names of the sheets in the Excel file, and the values
         are the corresponding DataFrames.
+
+    Notes
+    -----
+    The workbook is parsed with the calamine engine, which requires the
+    `fastexcel` package.
     """
 
-    data_dict = pl.read_excel(fsrc, sheet_id=0)
+    data_dict = pl.read_excel(fsrc, sheet_id=0, engine="calamine")
 
     return data_dict
 
 
-def preprocess_pokemon_evolutions_data(data: pl.DataFrame) -> pl.DataFrame:
+def preprocess_pokemon_evolutions_data(data: pl.LazyFrame) -> pl.LazyFrame:
     """Preprocess the Pokemon evolutions data.
 
     Parameters
     ----------
-    data : pl.DataFrame
-        DataFrames containing the loaded Pokemon evolution data.
+    data : pl.LazyFrame
+        LazyFrame representing the loaded Pokemon evolution data.
 
     Returns
     -------
-    pl.DataFrame
-        DataFrame containing the preprocessed Pokemon evolution data.
+    pl.LazyFrame
+        LazyFrame representing the preprocessed Pokemon evolution data.
     """
 
     col_mapper = {col: col.lower() for col in data.columns}
@@ -92,43 +97,52 @@ def preprocess_pokemon_evolutions_data(data: pl.DataFrame) -> pl.DataFrame:
 
 
 def view_combat_power_analysis(
-    pokemon: pl.DataFrame, pokemon_evolution: pl.DataFrame
-) -> pl.DataFrame:
+    pokemon: pl.LazyFrame, pokemon_evolution: pl.LazyFrame
+) -> pl.LazyFrame:
     """View the combat power analysis for all Pokemon that can experience
     evolution.
 
     Parameters
     ----------
-    pokemon : pl.DataFrame
-        DataFrame containing the preprocessed Pokemon data.
-    pokemon_evolution : pl.DataFrame
-        DataFrame containing the preprocessed Pokemon evolution data.
+    pokemon : pl.LazyFrame
+        LazyFrame representing the preprocessed Pokemon data.
+    pokemon_evolution : pl.LazyFrame
+        LazyFrame representing the preprocessed Pokemon evolution data.
 
     Returns
     -------
-    pl.DataFrame
-        DataFrame containing the combat power analysis for Pokemon that
+    pl.LazyFrame
+        LazyFrame representing the combat power analysis for Pokemon that
         can experience evolution.
+
+    Notes
+    -----
+    The final stage of each evolution is its last non-null stage, so the
+    evolution is only joined to the combat powers, once for its initial
+    stage and once for its final stage.
     """
 
     # Collect the data
-    final_stage = view_final_stage(pokemon_evolution)
-
     combat_power = view_combat_power(pokemon)
 
+    final_combat_power = combat_power.select("name", "combat_power")
+
     # Expressions
-    prop_change_combat_power_expr = pl.col("combat_power_right") / pl.col(
+    final_stage_expr = pl.coalesce("stage_3", "stage_2")
+
+    prop_change_combat_power_expr = pl.col("combat_power_final") / pl.col(
         "combat_power"
     )
 
     return (
-        pokemon_evolution.join(final_stage, on="stage_1")
+        pokemon_evolution.with_columns(final_stage=final_stage_expr)
+        .drop_nulls("final_stage")
         .join(combat_power, left_on="stage_1", right_on="name")
-        .join(combat_power, left_on="final_stage", right_on="name")
-        .join(pokemon, left_on="stage_1", right_on="name")
-        .filter(
-            (pl.col("final_stage") == pl.col("stage_2"))
-            | (pl.col("final_stage") == pl.col("stage_3"))
+        .join(
+            final_combat_power,
+            left_on="final_stage",
+            right_on="name",
+            suffix="_final",
         )
         .select(
             "stage_1",
@@ -137,53 +151,26 @@ def view_combat_power_analysis(
             "pokedex_number",
             "gen_introduced",
             initial_combat_power="combat_power",
-            final_combat_power="combat_power_right",
+            final_combat_power="combat_power_final",
             prop_change_combat_power=prop_change_combat_power_expr,
         )
         .sort("prop_change_combat_power")
     )
 
 
-def view_final_stage(pokemon_evolution: pl.DataFrame) -> pl.DataFrame:
-    """View the final stage for each initial Pokemon species.
-
-    Parameters
-    ----------
-    pokemon_evolution : pl.DataFrame
-        DataFrame containing the preprocessed Pokemon evolution data.
-
-    Returns
-    -------
-    pl.DataFrame
-        DataFrame containing the final stage for each initial Pokemon species.
-    """
-
-    # Expressions
-    final_stage_expr = (
-        pl.when(pl.col("stage_3").is_not_null())
-        .then("stage_3")
-        .when(pl.col("stage_2").is_not_null())
-        .then("stage_2")
-        .otherwise(pl.lit(None))
-    )
-
-    return pokemon_evolution.select("stage_1", final_stage=final_stage_expr).drop_nulls(
-        "final_stage"
-    )
-
-
-def view_combat_power(pokemon: pl.DataFrame) -> pl.DataFrame:
+def view_combat_power(pokemon: pl.LazyFrame) -> pl.LazyFrame:
     """View each Pokemon's combat power.
 
     Parameters
     ----------
-    pokemon : pl.DataFrame
-        DataFrame containing the preprocessed Pokemon data.
+    pokemon : pl.LazyFrame
+        LazyFrame representing the preprocessed Pokemon data.
 
     Returns
     -------
-    pl.DataFrame
-        DataFrame containing each Pokemon's combat power.
+    pl.LazyFrame
+        LazyFrame representing each Pokemon's combat power, alongside its
+        Pokedex number and the generation it was introduced in.
     """
 
     # Expressions
@@ -196,4 +183,6 @@ def view_combat_power(pokemon: pl.DataFrame) -> pl.DataFrame:
         + pl.col("speed")
     )
 
-    return pokemon.select("name", combat_power=combat_power_expr)
+    return pokemon.select(
+        "name", "pokedex_number", "gen_introduced", combat_power=combat_power_expr
+    )
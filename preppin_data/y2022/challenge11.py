@@ -125,22 +125,26 @@ def normalize_lesson_data(pre_data: pl.DataFrame) -> pl.DataFrame:
     Notes
     -----
     Primary key is {weekday, starts_at}
+
+    Each lesson takes the first non-null lesson and subject name recorded
+    for it. Lessons with no recorded lesson or subject name are dropped.
     """
 
     primary_key = ["weekday_name", "starts_at"]
 
+    # Expressions
+    lesson_name_expr = pl.col("lesson_name").drop_nulls().first()
+
+    subject_name_expr = pl.col("subject_name").drop_nulls().first()
+
+    has_name_expr = (
+        pl.col("lesson_name").is_not_null() | pl.col("subject_name").is_not_null()
+    )
+
     return (
-        pre_data.melt(
-            id_vars=primary_key,
-            value_vars=["lesson_name", "subject_name"],
-        )
-        .drop_nulls()
-        .unique()
-        .pivot(
-            values="value",
-            index=primary_key,
-            columns="variable",
-        )
+        pre_data.group_by(primary_key)
+        .agg(lesson_name=lesson_name_expr, subject_name=subject_name_expr)
+        .filter(has_name_expr)
     )
 
 
@@ -183,9 +187,34 @@ def view_mean_lesson_num_attended(
         DataFrame containing the mean number of attendees per lesson.
     """
 
-    # Expressions
-    mean_num_attended_expr = pl.mean("num_attended").over("weekday_name", "starts_at")
+    primary_key = ["weekday_name", "starts_at"]
+
+    # Collect the data
+    mean_num_attended = aggregate_mean_num_attended(lesson_week)
+
+    return lesson_week.join(lesson, on=primary_key).join(
+        mean_num_attended, on=primary_key
+    )
+
+
+def aggregate_mean_num_attended(lesson_week: pl.DataFrame) -> pl.DataFrame:
+    """Aggregate the mean number of attendees per lesson.
+
+    Parameters
+    ----------
+    lesson_week : pl.DataFrame
+        DataFrame containing the weekly lesson data.
+
+    Returns
+    -------
+    pl.DataFrame
+        DataFrame containing the mean number of attendees per lesson.
+
+    Notes
+    -----
+    Primary key is {weekday, starts_at}
+    """
 
-    return lesson_week.join(lesson, on=["weekday_name", "starts_at"]).with_columns(
-        mean_num_attended=mean_num_attended_expr
+    return lesson_week.group_by("weekday_name", "starts_at").agg(
+        mean_num_attended=pl.mean("num_attended")
     )
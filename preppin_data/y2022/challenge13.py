@@ -27,6 +27,11 @@ def solve(pareto_fsrc: str, prop: float = 0.8) -> pl.DataFrame:
     pl.DataFrame
         DataFrame containing the customer whose total sales together comprise
         the given proportion of sales.
+
+    Notes
+    -----
+    The query is collected with the streaming engine, so the orders are
+    aggregated per customer in batches as the CSV file is scanned.
     """
 
     # Load and preprocess the data
@@ -35,7 +40,7 @@ def solve(pareto_fsrc: str, prop: float = 0.8) -> pl.DataFrame:
     # Collect the output
     running_prop_sales = pre_data.pipe(view_running_prop_sales, prop)
 
-    return running_prop_sales.collect()
+    return running_prop_sales.collect(streaming=True)
 
 
 def preprocess_data(pareto_fsrc: str) -> pl.LazyFrame:
@@ -14,6 +14,17 @@ Outputs
 import polars as pl
 
 
+WEEKDAY_MAP = {
+    1: "Monday",
+    2: "Tuesday",
+    3: "Wednesday",
+    4: "Thursday",
+    5: "Friday",
+    6: "Saturday",
+    7: "Sunday",
+}
+
+
 def solve(pd_input_wk1_fsrc: str) -> tuple[pl.DataFrame]:
     """Solve challenge 1 of Preppin' Data 2023.
 
@@ -35,6 +46,8 @@ def solve(pd_input_wk1_fsrc: str) -> tuple[pl.DataFrame]:
     -----
     This function reads input data from a CSV file, preprocesses it, and
     then aggregates the total transaction values by different criteria.
+    The aggregates are collected together, so the CSV file is scanned and
+    preprocessed once.
     """
     # Load the data
     transaction = load_transactions_data(pd_input_wk1_fsrc)
@@ -43,10 +56,14 @@ def solve(pd_input_wk1_fsrc: str) -> tuple[pl.DataFrame]:
     pre_transaction = transaction.pipe(preprocess_transactions_data)
 
     # Aggregate the data
-    return (
-        pre_transaction.pipe(aggregate_total_value_by_bank).collect(),
-        pre_transaction.pipe(aggregate_total_value_by_bank_method_weekday).collect(),
-        pre_transaction.pipe(aggregate_total_value_by_bank_customer_code).collect(),
+    return tuple(
+        pl.collect_all(
+            [
+                pre_transaction.pipe(aggregate_total_value_by_bank),
+                pre_transaction.pipe(aggregate_total_value_by_bank_method_weekday),
+                pre_transaction.pipe(aggregate_total_value_by_bank_customer_code),
+            ]
+        )
     )
 
 
@@ -100,6 +117,10 @@ def clean_transactions_data(data: pl.DataFrame) -> pl.LazyFrame:
     -------
     pl.LazyFrame
         LazyFrame representing the clean source data.
+
+    Notes
+    -----
+    The bank is the part of the transaction code before the first "-".
     """
     col_mapper = {
         "Transaction Code": "transaction_code",
@@ -109,7 +130,9 @@ def clean_transactions_data(data: pl.DataFrame) -> pl.LazyFrame:
     }
 
     # Expressions
-    bank_expr = pl.col("Transaction Code").str.extract(r"^(\w+)")
+    bank_expr = (
+        pl.col("Transaction Code").str.split_exact("-", 1).struct.field("field_0")
+    )
 
     created_on_expr = pl.col("Transaction Date").cast(pl.Date)
 
@@ -164,14 +187,27 @@ def aggregate_total_value_by_bank_method_weekday(
     pl.LazyFrame
         LazyFrame representing the aggregated data, with total transaction value
         grouped by bank, transaction method, and weekday.
+
+    Notes
+    -----
+    The data is grouped by the ISO weekday number, which is mapped to the
+    weekday name after aggregating.
     """
-    weekday_expr = pl.col("created_on").dt.strftime("%A")
+    weekday_num_expr = pl.col("created_on").dt.weekday()
 
-    return pre_data.with_columns(weekday=weekday_expr).pipe(
-        aggregate_total_value,
-        "bank",
-        "transaction_method",
-        "weekday",
+    weekday_expr = pl.col("weekday").replace(
+        WEEKDAY_MAP, default=None, return_dtype=pl.Utf8
+    )
+
+    return (
+        pre_data.with_columns(weekday=weekday_num_expr)
+        .pipe(
+            aggregate_total_value,
+            "bank",
+            "transaction_method",
+            "weekday",
+        )
+        .with_columns(weekday_expr)
     )
 
 
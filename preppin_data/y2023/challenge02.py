@@ -97,7 +97,8 @@ def clean_transaction_data(data: pl.DataFrame) -> pl.LazyFrame:
     -----
     This function performs the following cleaning steps:
     - Renames columns for consistency and readability.
-    - Removes hyphens from the sort code and casts it to integer type.
+    - Removes hyphens from the sort code, keeping it as a string so any
+      leading zeros are kept.
     """
     col_mapper = {
         "Transaction ID": "transaction_id",
@@ -107,7 +108,7 @@ def clean_transaction_data(data: pl.DataFrame) -> pl.LazyFrame:
     }
 
     # Expressions
-    sort_code_expr = pl.col("Sort Code").str.replace_all("-", "").cast(pl.Int64)
+    sort_code_expr = pl.col("Sort Code").str.replace_all("-", "")
 
     return data.with_columns(sort_code_expr).rename(col_mapper)
 
@@ -182,15 +183,11 @@ def view_transaction_iban(
     - Constructs IBANs using the provided transaction and SWIFT data.
     - Joins transaction data with SWIFT data on bank name.
     - Creates IBANs based on a combination of SWIFT code, sort code, and
-      account number.
+      account number, concatenated in a single pass.
     """
     # Expressions
-    iban_expr = (
-        pl.lit("GB")
-        + pl.col("check_digits")
-        + pl.col("swift_code")
-        + pl.col("sort_code").cast(pl.Utf8)
-        + pl.col("account_number").cast(pl.Utf8)
+    iban_expr = pl.concat_str(
+        pl.lit("GB"), "check_digits", "swift_code", "sort_code", "account_number"
     )
 
     return pre_transaction.join(pre_swift, on="bank_name").select(
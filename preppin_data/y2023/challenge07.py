@@ -56,7 +56,9 @@ def solve(
     # Load the data
     account_holder = load_data(account_holder_fsrc)
 
-    account_info = load_data(account_info_fsrc)
+    account_info = load_data(
+        account_info_fsrc, schema_overrides={"Account Holder ID": pl.Utf8}
+    )
 
     transaction_detail = load_data(transaction_detail_fsrc)
 
@@ -79,13 +81,18 @@ def solve(
     ).collect()
 
 
-def load_data(fsrc: str) -> pl.LazyFrame:
+def load_data(
+    fsrc: str, schema_overrides: dict[str, pl.PolarsDataType] | None = None
+) -> pl.LazyFrame:
     """Load the data from the given CSV file.
 
     Parameters
     ----------
     fsrc: str
         File path to the input CSV file.
+    schema_overrides: dict[str, pl.PolarsDataType], optional
+        Data types of the columns that should not be inferred, by default
+        None.
 
     Returns
     -------
@@ -93,7 +100,7 @@ def load_data(fsrc: str) -> pl.LazyFrame:
         LazyFrame representing the data from the input CSV file.
     """
 
-    return pl.scan_csv(fsrc, try_parse_dates=True)
+    return pl.scan_csv(fsrc, schema_overrides=schema_overrides, try_parse_dates=True)
 
 
 def preprocess_account_holder(data: pl.LazyFrame) -> pl.LazyFrame:
@@ -140,7 +147,7 @@ def clean_account_holder(data: pl.LazyFrame) -> pl.LazyFrame:
     }
 
     # Expressions
-    contact_number_expr = pl.col("Contact Number").cast(pl.Utf8).str.pad_start(11, "0")
+    contact_number_expr = pl.col("Contact Number").cast(pl.Utf8).str.zfill(11)
 
     return data.with_columns(contact_number_expr).rename(col_mapper)
 
@@ -181,14 +188,12 @@ def reshape_account_info(reshaped_data: pl.LazyFrame) -> pl.LazyFrame:
     """
 
     # Expressions
-    split_account_holder_id_expr = pl.col("Account Holder ID").str.split(", ")
-
-    parse_account_holder_id_expr = pl.col("Account Holder ID").cast(pl.Int64)
+    split_account_holder_id_expr = (
+        pl.col("Account Holder ID").str.split(", ").cast(pl.List(pl.Int64))
+    )
 
-    return (
-        reshaped_data.with_columns(split_account_holder_id_expr)
-        .explode("Account Holder ID")
-        .with_columns(parse_account_holder_id_expr)
+    return reshaped_data.with_columns(split_account_holder_id_expr).explode(
+        "Account Holder ID"
     )
 
 
@@ -250,6 +255,10 @@ def clean_transaction_detail(data: pl.LazyFrame) -> pl.LazyFrame:
     -------
     pl.LazyFrame
         LazyFrame representing the cleaned transaction detail data.
+
+    Notes
+    -----
+    Values of "Cancelled?" other than "Y" or "N" give a null `is_cancelled`.
     """
 
     col_mapper = {
@@ -259,13 +268,9 @@ def clean_transaction_detail(data: pl.LazyFrame) -> pl.LazyFrame:
     }
 
     # Expressions
-    is_cancelled_expr = (
-        pl.when(pl.col("Cancelled?") == "Y")
-        .then(pl.lit(True))
-        .when(pl.col("Cancelled?") == "N")
-        .then(pl.lit(False))
-        .otherwise(pl.lit(None))
-    )
+    cancelled = pl.col("Cancelled?")
+
+    is_cancelled_expr = pl.when(cancelled.is_in(["Y", "N"])).then(cancelled == "Y")
 
     return (
         data.with_columns(is_cancelled=is_cancelled_expr)
@@ -354,21 +359,35 @@ def view_flagged_transactions(
     """
 
     # Predicates
-    is_platinum_account_expr = pl.col("account_type") != "Platinum"
+    is_not_platinum_account_expr = pl.col("account_type") != "Platinum"
 
     is_not_cancelled_expr = pl.col("is_cancelled").not_()
 
     is_greater_1000_expr = pl.col("transaction_value") > 1000
 
+    # Filter and project each side before the joins, so the join inputs are
+    # no larger than they need to be
+    candidate_transaction_detail = pre_transaction_detail.filter(
+        is_not_cancelled_expr & is_greater_1000_expr
+    )
+
+    candidate_account_info = pre_account_info.filter(
+        is_not_platinum_account_expr
+    ).select(
+        "account_number",
+        "account_holder_id",
+        "balance_taken_on",
+        "balance",
+    )
+
     return (
-        pre_transaction_detail.join(pre_transaction_path, on="transaction_id")
+        candidate_transaction_detail.join(pre_transaction_path, on="transaction_id")
         .join(
-            pre_account_info,
+            candidate_account_info,
             left_on="source_account_number",
             right_on="account_number",
         )
         .join(pre_account_holder, on="account_holder_id")
-        .filter(is_platinum_account_expr & is_not_cancelled_expr & is_greater_1000_expr)
         .select(
             "transaction_id",
             "destination_account_number",
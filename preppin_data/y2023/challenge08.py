@@ -110,23 +110,22 @@ def preprocess_trade_data(data_dict: dict[str, pl.LazyFrame]) -> pl.LazyFrame:
     Primary key is {trade_id}
     """
 
-    # Collect the data
+    # Annotate each file, then stack and clean the data in a single plan
     data_arr = [
-        data.pipe(clean_trade_data, file_path) for file_path, data in data_dict.items()
+        data.pipe(annotate_file_creation, file_path)
+        for file_path, data in data_dict.items()
     ]
 
-    return pl.concat(data_arr).pipe(reset_primary_key)
+    return pl.concat(data_arr).pipe(clean_trade_data).pipe(reset_primary_key)
 
 
-def clean_trade_data(data: pl.LazyFrame, file_path: str) -> pl.LazyFrame:
+def clean_trade_data(data: pl.LazyFrame) -> pl.LazyFrame:
     """Clean the trade data.
 
     Parameters
     ----------
     data : pl.LazyFrame
-        LazyFrame representing the trade data.
-    file_path : str
-        Path of the file.
+        LazyFrame representing the stacked and annotated trade data.
 
     Returns
     -------
@@ -144,11 +143,9 @@ def clean_trade_data(data: pl.LazyFrame, file_path: str) -> pl.LazyFrame:
     }
 
     return (
-        data.pipe(annotate_file_creation, file_path)
-        .pipe(clean_market_cap)
+        data.pipe(clean_market_cap)
         .pipe(clean_purchase_price)
         .drop_nulls(["Purchase Price", "Market Cap"])
-        .drop("file_path")
         .rename(col_mapper)
     )
 
@@ -175,7 +172,7 @@ def annotate_file_creation(data: pl.LazyFrame, file_path: str) -> pl.LazyFrame:
 
     file_month_expr = file_path_expr.str.extract(r"MOCK_DATA-(\d+)").fill_null("1")
 
-    file_date_expr = ("2023-" + file_month_expr + "-1").str.to_date()
+    file_date_expr = ("2023-" + file_month_expr + "-1").str.to_date("%Y-%m-%d")
 
     return data.with_columns(file_date=file_date_expr)
 
@@ -195,22 +192,28 @@ def clean_market_cap(data: pl.LazyFrame) -> pl.LazyFrame:
         column.
     """
 
+    multiplier_map = {
+        "K": 1000,
+        "M": 1_000_000,
+        "B": 1_000_000_000,
+    }
+
     # Expressions
-    market_cap_num_expr = (
-        pl.col("Market Cap").str.extract(r"(\d+.\d+|\d+)").cast(pl.Float64)
+    market_cap_groups_expr = pl.col("Market Cap").str.extract_groups(
+        r"(?<number>\d+.\d+|\d+)(?<suffix>[KMB]?)"
     )
 
-    market_cap_multiplier_expr = (
-        pl.when(pl.col("Market Cap").str.ends_with("K"))
-        .then(pl.lit(1000))
-        .when(pl.col("Market Cap").str.ends_with("M"))
-        .then(pl.lit(1_000_000))
-        .when(pl.col("Market Cap").str.ends_with("B"))
-        .then(pl.lit(1_000_000_000))
-        .otherwise(pl.lit(1))
+    market_cap_num_expr = market_cap_groups_expr.struct.field("number").cast(pl.Float64)
+
+    market_cap_multiplier_expr = market_cap_groups_expr.struct.field("suffix").replace(
+        multiplier_map, default=1, return_dtype=pl.Int64
     )
 
-    market_cap_expr = (market_cap_num_expr * market_cap_multiplier_expr).cast(pl.Int64)
+    market_cap_expr = (
+        (market_cap_num_expr * market_cap_multiplier_expr)
+        .cast(pl.Int64)
+        .alias("Market Cap")
+    )
 
     return data.with_columns(market_cap_expr)
 
@@ -271,13 +274,16 @@ def view_top_five_monthly_trades(pre_trade: pl.LazyFrame) -> pl.LazyFrame:
 
     return (
         pre_trade.pipe(categorize_trade)
+        .pipe(filter_top_five_categorized_trade)
         .pipe(rank_categorized_trade)
-        .filter(pl.col("rank") <= 5)
         .drop(
             "first_name",
             "last_name",
             "trade_id",
         )
+        .with_columns(
+            pl.col("market_cap_category", "purchase_price_category").cast(pl.Utf8)
+        )
         .sort(
             "file_date",
             "market_cap_category",
@@ -301,25 +307,29 @@ def categorize_trade(pre_trade: pl.LazyFrame) -> pl.LazyFrame:
         LazyFrame representing the categorized trade data.
     """
 
+    market_cap_categories = ["Small", "Medium", "Large", "Huge"]
+
+    purchase_price_categories = ["Small", "Medium", "Large", "Very Large"]
+
     # Expressions
     market_cap_category_expr = (
-        pl.when(pl.col("market_cap") < 100_000_000)
-        .then(pl.lit("Small"))
-        .when(pl.col("market_cap") < 1_000_000_000)
-        .then(pl.lit("Medium"))
-        .when(pl.col("market_cap") < 100_000_000_000)
-        .then(pl.lit("Large"))
-        .otherwise(pl.lit("Huge"))
+        pl.col("market_cap")
+        .cut(
+            [100_000_000, 1_000_000_000, 100_000_000_000],
+            labels=market_cap_categories,
+            left_closed=True,
+        )
+        .cast(pl.Enum(market_cap_categories))
     )
 
     purchase_price_category_expr = (
-        pl.when(pl.col("purchase_price") < 25_000)
-        .then(pl.lit("Small"))
-        .when(pl.col("purchase_price") < 50_000)
-        .then(pl.lit("Medium"))
-        .when(pl.col("purchase_price") < 75_000)
-        .then(pl.lit("Large"))
-        .otherwise(pl.lit("Very Large"))
+        pl.col("purchase_price")
+        .cut(
+            [25_000, 50_000, 75_000],
+            labels=purchase_price_categories,
+            left_closed=True,
+        )
+        .cast(pl.Enum(purchase_price_categories))
     )
 
     return pre_trade.with_columns(
@@ -328,6 +338,44 @@ def categorize_trade(pre_trade: pl.LazyFrame) -> pl.LazyFrame:
     )
 
 
+def filter_top_five_categorized_trade(categorized_data: pl.LazyFrame) -> pl.LazyFrame:
+    """Filter the trades that rank in the top five by purchase price within
+    the file date, market cap category, and purchase price category.
+
+    Parameters
+    ----------
+    categorized_data : pl.LazyFrame
+        LazyFrame representing the categorized trade data.
+
+    Returns
+    -------
+    pl.LazyFrame
+        LazyFrame representing the top five categorized trade data.
+
+    Notes
+    -----
+    A trade has a (min) rank of at most 5 if, and only if, its purchase price
+    is no greater than the fifth smallest purchase price in its group. This
+    selects the same trades, ties included, without ranking every trade.
+    """
+
+    # Expressions
+    fifth_purchase_price_expr = (
+        pl.col("purchase_price")
+        .bottom_k(5)
+        .max()
+        .over(
+            "file_date",
+            "market_cap_category",
+            "purchase_price_category",
+        )
+    )
+
+    return categorized_data.filter(
+        pl.col("purchase_price") <= fifth_purchase_price_expr
+    )
+
+
 def rank_categorized_trade(categorized_data: pl.LazyFrame) -> pl.LazyFrame:
     """Rank the purchase price by the file date, market cap category, and
     purchase price category.
@@ -353,9 +401,4 @@ def rank_categorized_trade(categorized_data: pl.LazyFrame) -> pl.LazyFrame:
         )
     )
 
-    return categorized_data.with_columns(rank=rank_expr).sort(
-        "file_date",
-        "market_cap_category",
-        "purchase_price_category",
-        "rank",
-    )
+    return categorized_data.with_columns(rank=rank_expr)
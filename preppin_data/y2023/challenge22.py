@@ -57,7 +57,7 @@ def preprocess_student_test_scores(input_file: str) -> pl.LazyFrame:
         )
         .lazy()
         .with_columns(
-            pl.col("subject").str.replace_many(
+            pl.col("subject").replace(
                 ["Engish", "Math", "Sciece"], ["English", "Mathematics", "Science"]
             ),
             pl.col("test_date").str.to_date("%m/%d/%Y"),
@@ -8,7 +8,7 @@ import polars as pl
 from .. import common_expressions as cx
 
 
-GRADE_MAP = pl.LazyFrame(
+GRADE_MAP = pl.DataFrame(
     [
         ("A", 1, 50),
         ("B", 2, 40),
@@ -26,18 +26,19 @@ def solve(
 ) -> pl.DataFrame:
     """Solve challenge 25 of Preppin' Data 2023."""
     # Preprocess the data
+    grade_map = GRADE_MAP.lazy()
     pre_east_student = preprocess_student(
-        east_students_fsrc, "%A, %d %B, %Y", GRADE_MAP, "alpha_grade"
+        east_students_fsrc, "%A, %d %B, %Y", grade_map, "alpha_grade"
     )
     pre_west_student = preprocess_student(
-        west_students_fsrc, "%d/%m/%Y", GRADE_MAP, "num_grade"
+        west_students_fsrc, "%d/%m/%Y", grade_map, "num_grade"
     )
     pre_school_lookup = preprocess_school_lookup(school_lookup_fsrc)
 
     # Complete the transformation
     return (
         pl.concat([pre_east_student, pre_west_student], how="diagonal")
-        .join(GRADE_MAP, on="grade_id")
+        .join(grade_map, on="grade_id")
         .with_columns(
             pl.col("student_id").str.extract(r"(\d+)").cast(pl.Int64),
             pl.col("student_id").str.extract(r"([A-Za-z]+)").alias("school_region"),
@@ -120,7 +121,7 @@ def preprocess_school_lookup(fsrc: str) -> pl.LazyFrame:
         pl.scan_csv(fsrc)
         .rename(renamer_dict)
         .with_columns(
-            pl.col("school_name").str.replace_many(
+            pl.col("school_name").replace(
                 ["St Marys", "Viliers Hill"], ["St. Mary's", "Villiers Hill"]
             )
         )
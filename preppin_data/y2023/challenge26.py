@@ -8,7 +8,7 @@ import polars as pl
 from . import challenge25
 
 
-SCHOOL_REGION_ALLOCATION = pl.LazyFrame(
+SCHOOL_REGION_ALLOCATION = pl.DataFrame(
     [("EAST", 75), ("WEST", 25)],
     schema=["school_region", "allocation"],
 )
@@ -22,7 +22,7 @@ def solve(
 ) -> pl.DataFrame:
     """Solve challenge 26 of Preppin' Data 2023."""
     # Preprocess the data
-    school_region_allocation = SCHOOL_REGION_ALLOCATION
+    school_region_allocation = SCHOOL_REGION_ALLOCATION.lazy()
     pre_student_info = preprocess_additional_student_info(addtional_student_info_fsrc)
     pre_student_performance = challenge25.solve(
         east_students_fsrc, west_students_fsrc, school_lookup_fsrc
@@ -9,6 +9,9 @@ Outputs
 - output/2024/wk01_flight_details.ndjson
 """
 
+from functools import lru_cache
+from pathlib import Path
+
 import polars as pl
 
 
@@ -48,26 +51,26 @@ def preprocess_flight_detail_data(pd_input_wk1_fsrc: str) -> pl.LazyFrame:
 
     Notes
     -----
-    The function loads, reshapes, and cleans the flight details data.
+    The function loads and cleans the flight details data.
 
     Primary key is {flight_detail_id} (this is a calculated field.)
     """
 
     return (
         load_flight_detail_data(pd_input_wk1_fsrc)
-        .pipe(reshape_flight_details_data)
         .pipe(clean_flight_details_data)
         .with_row_index("flight_detail_id", offset=1)
     )
 
 
 def load_flight_detail_data(pd_input_wk1_fsrc: str) -> pl.LazyFrame:
-    """Load data from the input CSV file containing flight details data.
+    """Load data from the input file containing flight details data.
 
     Parameters
     ----------
     pd_input_wk1_fsrc : str
-        Filepath of the input CSV file for Week 1.
+        Filepath of the input CSV file for Week 1, or of a Parquet file
+        staged from it with `stage_flight_detail_data`.
 
     Returns
     -------
@@ -75,76 +78,74 @@ def load_flight_detail_data(pd_input_wk1_fsrc: str) -> pl.LazyFrame:
         LazyFrame representing the input flight details data.
     """
 
+    if Path(pd_input_wk1_fsrc).suffix.lower() == ".parquet":
+        return pl.scan_parquet(pd_input_wk1_fsrc)
+
     return pl.scan_csv(pd_input_wk1_fsrc)
 
 
-def reshape_flight_details_data(data: pl.LazyFrame) -> pl.LazyFrame:
-    """Reshape the flight details data.
+def stage_flight_detail_data(pd_input_wk1_fsrc: str, stage_fdst: str) -> None:
+    """Stage the input CSV file for Week 1 as a Parquet file.
 
     Parameters
     ----------
-    data : pl.LazyFrame
-        LazyFrame representing the input flight details data.
+    pd_input_wk1_fsrc : str
+        Filepath of the input CSV file for Week 1.
+    stage_fdst : str
+        Filepath of the Parquet file to write.
 
-    Returns
-    -------
-    pl.LazyFrame
-        LazyFrame representing the reshaped flight details data.
+    Notes
+    -----
+    The Week 1 input is reused by challenges 2 and 3, so repeated runs can
+    pass the staged file in place of the CSV file and skip parsing the CSV.
     """
 
-    # Expressions
-    flight_detail_patt = r"^(.+)//(.+)//(.+)-(.+)//(.+)//(.+)$"
-
-    flight_details_fields = [
-        "flew_on",
-        "flight_number",
-        "from",
-        "to",
-        "seat_class",
-        "price",
-    ]
-
-    split_flight_details_expr = (
-        pl.col("Flight Details")
-        .str.extract_groups(flight_detail_patt)
-        .struct.rename_fields(flight_details_fields)
+    pl.scan_csv(pd_input_wk1_fsrc).sink_parquet(
+        stage_fdst, compression="zstd", statistics=True
     )
 
-    return data.with_columns(split_flight_details_expr).unnest("Flight Details")
 
-
-def clean_flight_details_data(reshaped_data: pl.LazyFrame) -> pl.LazyFrame:
+def clean_flight_details_data(data: pl.LazyFrame) -> pl.LazyFrame:
     """Clean the flight details data.
 
     Parameters
     ----------
-    reshaped_data : pl.LazyFrame
-        LazyFrame representing the reshaped flight details data.
+    data : pl.LazyFrame
+        LazyFrame representing the input flight details data.
 
     Returns
     -------
     pl.LazyFrame
         LazyFrame representing the cleansed flight details data.
-    """
 
-    col_mapper = {
-        "Flow Card?": "has_flow_card",
-        "Bags Checked": "num_bags_checked",
-        "Meal Type": "meal_type",
-    }
+    Notes
+    -----
+    The flight details are split, cast, and renamed in a single projection,
+    so the split fields are never materialised as struct columns.
+    """
 
     # Expressions
-    flew_on_expr = pl.col("flew_on").str.to_date()
+    flight_details_expr = pl.col("Flight Details").str.split_exact("//", 4)
+
+    route_expr = flight_details_expr.struct.field("field_2").str.split_exact("-", 1)
 
-    price_expr = pl.col("price").cast(pl.Float64)
+    flew_on_expr = flight_details_expr.struct.field("field_0").str.to_date("%Y-%m-%d")
 
-    has_flow_card_expr = pl.col("Flow Card?").cast(pl.Boolean)
+    price_expr = flight_details_expr.struct.field("field_4").cast(pl.Float64)
 
-    return reshaped_data.with_columns(
-        flew_on_expr,
-        price_expr,
-        has_flow_card_expr,
-    ).rename(col_mapper)
+    has_flow_card_expr = pl.col("Flow Card?") != 0
+
+    return data.select(
+        flew_on_expr.alias("flew_on"),
+        flight_details_expr.struct.field("field_1").alias("flight_number"),
+        route_expr.struct.field("field_0").alias("from"),
+        route_expr.struct.field("field_1").alias("to"),
+        flight_details_expr.struct.field("field_3").alias("seat_class"),
+        price_expr.alias("price"),
+        has_flow_card_expr.alias("has_flow_card"),
+        pl.col("Bags Checked").alias("num_bags_checked"),
+        pl.col("Meal Type").alias("meal_type"),
+    )
 
 
 def preprocess_fixed_flight_detail_data(pd_input_wk1_fsrc: str) -> pl.LazyFrame:
@@ -178,6 +179,37 @@ def preprocess_fixed_flight_detail_data(pd_input_wk1_fsrc: str) -> pl.LazyFrame:
     )
 
 
+@lru_cache(maxsize=1)
+def collect_fixed_flight_detail_data(pd_input_wk1_fsrc: str) -> pl.DataFrame:
+    """Collect the preprocessed flight details data, with the correct
+    assigned seat classes.
+
+    Parameters
+    ----------
+    pd_input_wk1_fsrc : str
+        Filepath of the input CSV file for Week 1.
+
+    Returns
+    -------
+    pl.DataFrame
+        DataFrame containing the preprocessed flight details data with the
+        correct assigned seat classes.
+
+    Notes
+    -----
+    The result is cached on the filepath, so challenges 2 and 3 share a
+    single parse and clean of the Week 1 input when solved in the same
+    session.
+
+    The cache is keyed only on the filepath, not on the file's contents. If
+    the file (or the staged Parquet file) is rewritten in the same session,
+    the stale result is returned until
+    `collect_fixed_flight_detail_data.cache_clear()` is called.
+    """
+
+    return preprocess_fixed_flight_detail_data(pd_input_wk1_fsrc).collect()
+
+
 def map_flight_detail_seat_class(cleaned_data: pl.LazyFrame) -> pl.LazyFrame:
     """Fix the assigned seat class.
 
@@ -11,7 +11,7 @@ Outputs
 
 import polars as pl
 
-from .challenge01 import preprocess_fixed_flight_detail_data
+from .challenge01 import collect_fixed_flight_detail_data
 
 
 def solve(pd_input_wk1_fsrc: str) -> pl.DataFrame:
@@ -28,7 +28,7 @@ def solve(pd_input_wk1_fsrc: str) -> pl.DataFrame:
     """
 
     # Preprocess the (fixed) flight details data
-    pre_data = preprocess_fixed_flight_detail_data(pd_input_wk1_fsrc)
+    pre_data = collect_fixed_flight_detail_data(pd_input_wk1_fsrc).lazy()
 
     # Collect the output
     quarterly_ticket_price_analysis = pre_data.pipe(
@@ -12,7 +12,7 @@ Outputs
 
 import polars as pl
 
-from .challenge01 import preprocess_fixed_flight_detail_data
+from .challenge01 import collect_fixed_flight_detail_data
 
 
 def solve(pd_input_wk1_fsrc: str, pd_input_wk3_fsrc: str) -> pl.DataFrame:
@@ -33,7 +33,7 @@ def solve(pd_input_wk1_fsrc: str, pd_input_wk3_fsrc: str) -> pl.DataFrame:
     """
 
     # Preprocess the data
-    pre_flight_detail = preprocess_fixed_flight_detail_data(pd_input_wk1_fsrc)
+    pre_flight_detail = collect_fixed_flight_detail_data(pd_input_wk1_fsrc).lazy()
 
     pre_target_sales = preprocess_target_sales_data(pd_input_wk3_fsrc, 2024)
 
@@ -42,7 +42,7 @@ def solve(pd_input_wk1_fsrc: str, pd_input_wk3_fsrc: str) -> pl.DataFrame:
         pre_flight_detail, pre_target_sales
     )
 
-    return performance_against_target
+    return performance_against_target.collect()
 
 
 def preprocess_target_sales_data(
@@ -177,25 +177,25 @@ def month_starts_on_expr(month_col: str, calendar_year: int) -> pl.Expr:
 
     starts_on_expr = calendar_year_str + month_expr + "-01"
 
-    return starts_on_expr.str.to_date()
+    return starts_on_expr.str.to_date("%Y-%m-%d")
 
 
 def view_performance_against_target(
-    pre_flight_detail: pl.DataFrame, pre_target_sales: pl.DataFrame
-) -> pl.DataFrame:
+    pre_flight_detail: pl.LazyFrame, pre_target_sales: pl.DataFrame
+) -> pl.LazyFrame:
     """View the performance against target sales.
 
     Parameters
     ----------
-    pre_flight_detail : pl.DataFrame
-        DataFrame containing pre-processed flight detail data.
+    pre_flight_detail : pl.LazyFrame
+        LazyFrame representing the pre-processed flight detail data.
     pre_target_sales : pl.DataFrame
         DataFrame containing pre-processed target sales data.
 
     Returns
     -------
-    pl.DataFrame
-        DataFrame containing performance metrics against target sales.
+    pl.LazyFrame
+        LazyFrame representing the performance metrics against target sales.
     """
 
     # Aggregate the total monthly sales data
@@ -204,40 +204,40 @@ def view_performance_against_target(
     # Expressions
     different_to_target_expr = pl.col("total_sales") - pl.col("target_sales")
 
-    return pre_target_sales.join(  # .join(SEAT_CLASS, on="seat_class_code")
-        total_monthly_sales,
-        left_on=["seat_class", "target_month"],
-        right_on=["seat_class", "flight_month"],
-    ).select(
-        "seat_class",
-        "target_month",
-        "total_sales",
-        "target_sales",
-        difference_to_target=different_to_target_expr,
+    return (
+        pre_target_sales.lazy()
+        .join(
+            total_monthly_sales,
+            left_on=["seat_class", "target_month"],
+            right_on=["seat_class", "flight_month"],
+        )
+        .select(
+            "seat_class",
+            "target_month",
+            "total_sales",
+            "target_sales",
+            difference_to_target=different_to_target_expr,
+        )
     )
 
 
-def view_total_montly_sales(pre_flight_detail: pl.LazyFrame) -> pl.DataFrame:
+def view_total_montly_sales(pre_flight_detail: pl.LazyFrame) -> pl.LazyFrame:
     """View the total monthly sales by seat classs.
 
     Parameters
     ----------
-    pre_flight_detail : pl.DataFrame
-        DataFrame containing flight detail price data.
+    pre_flight_detail : pl.LazyFrame
+        LazyFrame representing the flight detail price data.
 
     Returns
     -------
-    pl.DataFrame
-        DataFrame containing the total monthly sales by seat classs.
+    pl.LazyFrame
+        LazyFrame representing the total monthly sales by seat classs.
     """
 
     flight_month_expr = pl.col("flew_on").dt.strftime("%Y-%m")
 
-    return (
-        pre_flight_detail.group_by(
-            "seat_class",
-            flight_month=flight_month_expr,
-        )
-        .agg(total_sales=pl.sum("price"))
-        .collect()
-    )
+    return pre_flight_detail.group_by(
+        "seat_class",
+        flight_month=flight_month_expr,
+    ).agg(total_sales=pl.sum("price"))